@@ -1,6 +1,7 @@
 from __future__ import annotations
 import contextlib
 import json
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Set
@@ -10,6 +11,11 @@ from typing import Dict, List, Optional, Set
 class CatalogFile:
     path: str  # absolute path on disk
 
+    @functools.cached_property
+    def display_name(self) -> str:
+        # Computed on first use; update_file_path drops it when path changes
+        return Path(self.path).name
+
 
 @dataclass
 class CatalogFolder:
@@ -185,6 +191,7 @@ class CatalogService:
             for cf in folder.files:
                 if cf.path == old_abs:
                     cf.path = new_abs
+                    cf.__dict__.pop("display_name", None)
                     updated = True
                     break
             if updated:
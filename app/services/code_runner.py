@@ -1,11 +1,14 @@
 from __future__ import annotations
 import contextlib
 import json
+import os
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 
 class CodeRunner:
@@ -120,3 +123,91 @@ class CodeRunner:
             if result_path is not None:
                 with contextlib.suppress(Exception):
                     result_path.unlink(missing_ok=True)  # type: ignore[arg-type]
+
+    def run_python_stream(
+        self,
+        code: str,
+        on_output: Callable[[str], None],
+        cwd: Optional[Path] = None,
+        timeout_seconds: float = 5.0,
+    ) -> int:
+        """Run the given Python code, passing output to ``on_output`` as it arrives.
+
+        stdout and stderr are merged in the order the snippet wrote them.
+        Called on the runner's thread; returns the exit code.
+        """
+        if getattr(sys, "frozen", False):
+            # The frozen worker reports through a result file, so no streaming
+            rc, out, err = self.run_python(code, cwd, timeout_seconds)
+            if out or err:
+                on_output((out or "") + (err or ""))
+            return rc
+
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".py", delete=False, encoding="utf-8"
+        ) as tmp:
+            code_path = Path(tmp.name)
+            tmp.write(code)
+            tmp.flush()
+
+        timed_out = threading.Event()
+        # Own process group, so a kill also reaches children the snippet
+        # started (they would otherwise hold the output pipe open)
+        if sys.platform == "win32":
+            group = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group = {"start_new_session": True}
+        try:
+            # -u: unbuffered, so prints reach us when they happen
+            proc = subprocess.Popen(
+                [sys.executable, "-u", str(code_path)],
+                cwd=str(cwd) if cwd else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                **group,
+            )
+        except Exception as exc:
+            with contextlib.suppress(Exception):
+                code_path.unlink(missing_ok=True)  # type: ignore[arg-type]
+            on_output(f"[Runner error] {exc}")
+            return 1
+
+        def _kill() -> None:
+            with contextlib.suppress(Exception):
+                if sys.platform == "win32":
+                    subprocess.run(
+                        ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                        capture_output=True,
+                    )
+                else:
+                    os.killpg(proc.pid, signal.SIGKILL)
+            with contextlib.suppress(Exception):
+                proc.kill()
+            with contextlib.suppress(Exception):
+                proc.stdout.close()
+
+        def _time_out() -> None:
+            timed_out.set()
+            _kill()
+
+        timer = threading.Timer(timeout_seconds, _time_out)
+        timer.daemon = True
+        timer.start()
+        try:
+            for line in proc.stdout or ():
+                on_output(line)
+            rc = proc.wait()
+        except Exception as exc:
+            on_output(f"[Runner error] {exc}")
+            _kill()
+            rc = 1
+        finally:
+            timer.cancel()
+            with contextlib.suppress(Exception):
+                code_path.unlink(missing_ok=True)  # type: ignore[arg-type]
+        if timed_out.is_set():
+            on_output("\n[Timed out]")
+            return 124
+        return rc
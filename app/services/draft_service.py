@@ -4,6 +4,10 @@ import os
 from pathlib import Path
 from typing import Optional
 
+# Autosave writes whole drafts; a larger buffer than io's 8 KiB default keeps
+# multi-hundred-KB notes down to a handful of write syscalls.
+_WRITE_BUFFER_SIZE = 128 * 1024
+
 
 class DraftService:
     """Manages per-instance draft storage and simple instance slot locking.
@@ -61,16 +65,40 @@ class DraftService:
         if not path.exists():
             return ""
         try:
-            return path.read_text(encoding=encoding)
+            text = path.read_bytes().decode(encoding)
         except Exception:
             return ""
+        # Match read_text()'s universal newlines for drafts written on Windows
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
 
     def save_draft(self, index: int, text: str, encoding: str = "utf-8") -> Path:
         path = self._draft_path(index)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(text, encoding=encoding)
+        with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(text.encode(encoding))
         return path
 
+    def append_draft(
+        self, index: int, text: str, expected_size: int, encoding: str = "utf-8"
+    ) -> Optional[int]:
+        """Append to a draft whose file is still ``expected_size`` bytes long.
+
+        Returns the new size, or None (writing nothing) when the file is missing
+        or was changed elsewhere, so the caller can fall back to save_draft().
+        """
+        path = self._draft_path(index)
+        try:
+            with open(path, "r+b") as f:
+                if f.seek(0, os.SEEK_END) != expected_size:
+                    return None
+                data = text.encode(encoding)
+                f.write(data)
+        except FileNotFoundError:
+            return None
+        return expected_size + len(data)
+
     def clear_draft(self, index: int) -> None:
         with contextlib.suppress(Exception):
             self._draft_path(index).unlink(missing_ok=True)
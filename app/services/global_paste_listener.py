@@ -66,6 +66,10 @@ class GlobalPasteListener:
             self._hk_ctrl_v = None
             self._hk_cmd_v = None
 
+    @property
+    def is_active(self) -> bool:
+        return self._active
+
     def stop(self) -> None:
         self._active = False
         with contextlib.suppress(Exception):
@@ -1,11 +1,14 @@
 from __future__ import annotations
+import bisect
 import contextlib
+import functools
 import itertools
 import re
 import tkinter as tk
 import tkinter.font as tkfont
-from typing import List, Tuple
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 
 try:
     # Optional dependency; highlight gracefully if missing
@@ -18,6 +21,132 @@ except Exception:
     _PYGMENTS_AVAILABLE = False
 from app.ui.theme import ThemeColors, DARK_THEME
 
+# Block size for the linear part of the prefix/suffix search in _dirty_span()
+_DIFF_BLOCK = 4096
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    limit = min(len(a), len(b))
+    i = 0
+    while i < limit and a[i : i + _DIFF_BLOCK] == b[i : i + _DIFF_BLOCK]:
+        i += _DIFF_BLOCK
+    i = min(i, limit)
+    hi = min(i + _DIFF_BLOCK, limit)
+    while i < hi and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _common_suffix_len(a: str, b: str, limit: int) -> int:
+    n = 0
+    la, lb = len(a), len(b)
+    while (
+        n + _DIFF_BLOCK <= limit
+        and a[la - n - _DIFF_BLOCK : la - n] == b[lb - n - _DIFF_BLOCK : lb - n]
+    ):
+        n += _DIFF_BLOCK
+    while n < limit and a[la - n - 1] == b[lb - n - 1]:
+        n += 1
+    return n
+
+
+def _line_span(content: str, first: int, last: int) -> Tuple[int, int]:
+    """Offsets of 1-based lines ``first``..``last`` (inclusive, with newline)."""
+    start = 0
+    for _ in range(first - 1):
+        nl = content.find("\n", start)
+        if nl == -1:
+            break
+        start = nl + 1
+    end = start
+    for _ in range(last - first + 1):
+        nl = content.find("\n", end)
+        end = len(content) if nl == -1 else nl + 1
+    return start, end
+
+
+# Every tag _tag_for_token() can return
+_CODE_TOKEN_TAGS = (
+    "md_code_cmt",
+    "md_code_kw",
+    "md_code_func",
+    "md_code_class",
+    "md_code_builtin",
+    "md_code_name",
+    "md_code_str",
+    "md_code_num",
+    "md_code_op",
+    "md_code_punc",
+    "md_code_deco",
+)
+
+
+def _tag_for_token(tok_type) -> Optional[str]:
+    # Map a pygments token type to our tag, via its in-tree hierarchy
+    if tok_type in Token.Comment or str(tok_type).startswith("Token.Comment"):
+        return "md_code_cmt"
+    if tok_type in Token.Keyword or str(tok_type).startswith("Token.Keyword"):
+        return "md_code_kw"
+    if str(tok_type).startswith("Token.Name.Function"):
+        return "md_code_func"
+    if str(tok_type).startswith("Token.Name.Class"):
+        return "md_code_class"
+    if str(tok_type).startswith("Token.Name.Builtin"):
+        return "md_code_builtin"
+    if tok_type in Token.Name or str(tok_type).startswith("Token.Name"):
+        return "md_code_name"
+    if tok_type in Token.String or str(tok_type).startswith("Token.String"):
+        return "md_code_str"
+    if tok_type in Token.Number or str(tok_type).startswith("Token.Number"):
+        return "md_code_num"
+    if tok_type in Token.Operator or str(tok_type).startswith("Token.Operator"):
+        return "md_code_op"
+    if tok_type in Token.Punctuation or str(tok_type).startswith("Token.Punctuation"):
+        return "md_code_punc"
+    if str(tok_type).startswith("Token.Name.Decorator"):
+        return "md_code_deco"
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _lexer_for_name(lang_raw: str):
+    # Lexer lookup walks pygments' plugin registry; do it once per language
+    try:
+        return get_lexer_by_name(lang_raw, stripall=False)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _code_token_spans(
+    lang_raw: str, code_text: str
+) -> Tuple[Tuple[str, int, int], ...]:
+    """Token tag spans relative to ``code_text``.
+
+    Keyed on the block's language and text, so unchanged fenced blocks skip
+    lexing on every pass. Safe to call from the highlighter's worker.
+    """
+    lexer = _lexer_for_name(lang_raw) if lang_raw else None
+    if lexer is None:
+        try:
+            # guess_lexer may be expensive; bound input size
+            lexer = guess_lexer(code_text[:4000])
+        except Exception:
+            lexer = None
+    if lexer is None:
+        return ()
+    spans: List[Tuple[str, int, int]] = []
+    offset = 0
+    for tok_type, tok_text in lex(code_text, lexer):
+        if not tok_text:
+            continue
+        tag = _tag_for_token(tok_type)
+        # Skip pure whitespace to reduce tag churn
+        if tag and not tok_text.isspace():
+            spans.append((tag, offset, offset + len(tok_text)))
+        offset += len(tok_text)
+    return tuple(spans)
+
 
 @dataclass(frozen=True)
 class LinkInteraction:
@@ -34,6 +163,24 @@ class CodeRunInteraction:
     index: int
 
 
+@dataclass
+class HighlightResult:
+    """Tag spans computed from a content snapshot, ready to apply to a widget."""
+
+    content: str
+    spans: List[Tuple[str, int, int]] = field(default_factory=list)
+    dynamic_spans: List[Tuple[str, int, int]] = field(default_factory=list)
+    underline_tags: List[str] = field(default_factory=list)
+    links: List[LinkInteraction] = field(default_factory=list)
+    code_runs: List[CodeRunInteraction] = field(default_factory=list)
+    # Partial passes use their own prefix so link tags never collide
+    link_tag_prefix: str = "md_link_target_"
+    # Tk index pairs per tag for spans + dynamic_spans, built by scan()
+    indices: Dict[str, List[str]] = field(default_factory=dict)
+    # Fenced blocks in order: (start, end, body_start, body_end, lang)
+    fences: List[Tuple[int, int, int, int, str]] = field(default_factory=list)
+
+
 class MarkdownHighlighter:
     """Applies Markdown styling to a Tkinter Text widget using tags.
 
@@ -46,6 +193,41 @@ class MarkdownHighlighter:
     OUTPUT_HEADER = "### Output: ----\n"
     OUTPUT_FOOTER = "--------------------\n"
 
+    # How often the Tk thread checks for a finished background scan
+    RESULT_POLL_MS = 10
+
+    # Patterns are compiled once at import and shared by every instance
+    _re_heading = re.compile(r"^(#{1,6})[\t ]+(.+)$", re.MULTILINE)
+    _re_quote = re.compile(r"\"([^\n]+?)\"")
+    _re_bold = re.compile(r"(\*\*)([^\n]+?)\1")
+    _re_italic = re.compile(r"(?<!\*)\*([^\n*]+?)\*(?!\*)")
+    _re_bold_italic = re.compile(r"(\*\*\*|___)([^\n]+?)\1")
+    _re_strike = re.compile(r"~~([^\n]+?)~~")
+    _re_inline_code = re.compile(r"`([^`\n]+?)`")
+    _re_fenced_code = re.compile(
+        r"^```(?P<lang>[^\n`]*)\n(?P<body>[\s\S]*?)^```",
+        re.MULTILINE,
+    )
+    _re_blockquote = re.compile(r"^>[\t ]?.*$", re.MULTILINE)
+    # Numeric values: integers, comma-grouped, and decimals (including leading .5)
+    _re_number = re.compile(
+        r"(?<!\w)(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?!\w)|(?<![\w.])\.\d+(?!\w)"
+    )
+    # Bracketed text not part of a Markdown link (no immediate opening paren after ])
+    _re_brackets = re.compile(r"\[([^\]\n]+)\](?!\()")
+    # Granular list patterns: unordered and ordered, with named groups
+    _re_ul = re.compile(
+        r"^(?P<indent>[\t ]*)(?P<marker>[-*+])[\t ]+(?P<text>.+)$",
+        re.MULTILINE,
+    )
+    _re_ol = re.compile(
+        r"^(?P<indent>[\t ]*)(?P<num>\d+)\.[\t ]+(?P<text>.+)$",
+        re.MULTILINE,
+    )
+    _re_link = re.compile(r"\[([^\]\n]+)\]\(([^)\n]+)\)")
+    # A character every line-local pattern needs at least one of
+    _re_any_syntax = re.compile(r'[#*_~`>\[+"\d-]')
+
     def __init__(
         self,
         debounce_ms: int = 120,
@@ -57,36 +239,24 @@ class MarkdownHighlighter:
         # Collected interactive regions from the last highlight pass
         self._link_interactions: List[LinkInteraction] = []
         self._code_run_interactions: List[CodeRunInteraction] = []
-
-        # Precompile patterns
-        self._re_heading = re.compile(r"^(#{1,6})[\t ]+(.+)$", re.MULTILINE)
-        self._re_quote = re.compile(r"\"([^\n]+?)\"")
-        self._re_bold = re.compile(r"(\*\*)([^\n]+?)\1")
-        self._re_italic = re.compile(r"(?<!\*)\*([^\n*]+?)\*(?!\*)")
-        self._re_bold_italic = re.compile(r"(\*\*\*|___)([^\n]+?)\1")
-        self._re_strike = re.compile(r"~~([^\n]+?)~~")
-        self._re_inline_code = re.compile(r"`([^`\n]+?)`")
-        self._re_fenced_code = re.compile(
-            r"^```(?P<lang>[^\n`]*)\n(?P<body>[\s\S]*?)^```",
-            re.MULTILINE,
-        )
-        self._re_blockquote = re.compile(r"^>[\t ]?.*$", re.MULTILINE)
-        # Numeric values: integers, comma-grouped, and decimals (including leading .5)
-        self._re_number = re.compile(
-            r"(?<!\w)(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?!\w)|(?<![\w.])\.\d+(?!\w)"
-        )
-        # Bracketed text not part of a Markdown link (no immediate opening paren after ])
-        self._re_brackets = re.compile(r"\[([^\]\n]+)\](?!\()")
-        # Granular list patterns: unordered and ordered, with named groups
-        self._re_ul = re.compile(
-            r"^(?P<indent>[\t ]*)(?P<marker>[-*+])[\t ]+(?P<text>.+)$",
-            re.MULTILINE,
+        # Bumped only when the link/code-run set changes, so callers can skip
+        # re-binding handlers after passes that left it untouched
+        self.interactions_version: int = 0
+        # Tags applied by the last highlight pass, keyed by widget id, so clear()
+        # only touches what was actually used instead of every known tag.
+        self._applied: Dict[int, Set[str]] = {}
+        self._dynamic_tags: Dict[int, List[str]] = {}
+        # Background scanning: one worker, latest request per widget wins
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="MarkdownHighlighter"
         )
-        self._re_ol = re.compile(
-            r"^(?P<indent>[\t ]*)(?P<num>\d+)\.[\t ]+(?P<text>.+)$",
-            re.MULTILINE,
-        )
-        self._re_link = re.compile(r"\[([^\]\n]+)\]\(([^)\n]+)\)")
+        self._pending: Dict[int, Future] = {}
+        self._generations: Dict[int, int] = {}
+        # Content the widget's tags currently describe, for incremental passes
+        self._last_content: Dict[int, str] = {}
+        # Fence extents for that content: the only state spanning lines
+        self._fences: Dict[int, List[Tuple[int, int, int, int, str]]] = {}
+        self._partial_serial = itertools.count(1)
 
         self._all_tags = [
             "md_h1",
@@ -137,6 +307,7 @@ class MarkdownHighlighter:
             # Highlights
             "md_number",
             "md_brackets",
+            "md_code_run",
         ]
 
     def _idx(self, char_index: int) -> str:
@@ -312,7 +483,28 @@ class MarkdownHighlighter:
 
         self._configured_widget_id = id(text)
 
-    def clear(self, text: tk.Text) -> None:
+    def clear(self, text: tk.Text, keep: Set[str] = frozenset()) -> None:
+        """Remove markdown tags from ``text``.
+
+        Dynamic tags named in ``keep`` are only emptied, not deleted, so any
+        event bindings on them survive into the next pass.
+        """
+        key = id(text)
+        applied = self._applied.pop(key, None)
+        dynamic = self._dynamic_tags.pop(key, None)
+        if applied is not None and dynamic is not None:
+            for tag in applied:
+                text.tag_remove(tag, "1.0", tk.END)
+            for tag in dynamic:
+                if tag in keep:
+                    text.tag_remove(tag, "1.0", tk.END)
+                    continue
+                try:
+                    text.tag_delete(tag)
+                except Exception:
+                    text.tag_remove(tag, "1.0", tk.END)
+            return
+        # Unknown widget state: fall back to a full sweep
         for tag in self._all_tags:
             text.tag_remove(tag, "1.0", tk.END)
         # Remove dynamically created link target tags
@@ -326,55 +518,95 @@ class MarkdownHighlighter:
                     or name.startswith("md_code_body_")
                     or name.startswith("md_code_lang_")
                 ):
+                    if name in keep:
+                        text.tag_remove(tag, "1.0", tk.END)
+                        continue
                     try:
                         text.tag_delete(tag)
                     except Exception:
                         text.tag_remove(tag, "1.0", tk.END)
 
-    def _apply_span(self, text: tk.Text, tag: str, start: int, end: int) -> None:
+    @staticmethod
+    def _group_indices(
+        content: str, spans: Iterable[Tuple[str, int, int]], first_line: int = 1
+    ) -> Dict[str, List[str]]:
+        """Tk "line.col" index pairs per tag for spans over ``content``.
+
+        Plain line.col indices spare Tk from walking "1.0+Nc" offsets char by
+        char, and building them is pure Python, so scans do it off the Tk
+        thread. ``first_line`` is the buffer line ``content`` starts on.
+        """
+        starts = [0]
+        starts.extend(itertools.accumulate(len(ln) + 1 for ln in content.split("\n")))
+        by_tag: Dict[str, List[str]] = {}
+        for tag, start, end in spans:
+            i = bisect.bisect_right(starts, start) - 1
+            j = bisect.bisect_right(starts, end) - 1
+            by_tag.setdefault(tag, []).extend(
+                (
+                    f"{first_line + i}.{start - starts[i]}",
+                    f"{first_line + j}.{end - starts[j]}",
+                )
+            )
+        return by_tag
+
+    @staticmethod
+    def _tag_indices(text: tk.Text, by_tag: Dict[str, List[str]]) -> Set[str]:
+        """One variadic tag_add per tag; returns the tags used."""
+        for tag, indices in by_tag.items():
+            text.tag_add(tag, *indices)
+        return set(by_tag)
+
+    def _apply_span(self, res: HighlightResult, tag: str, start: int, end: int) -> None:
         if start < end:
-            text.tag_add(tag, self._idx(start), self._idx(end))
+            res.spans.append((tag, start, end))
+
+    def _add_dynamic(
+        self, res: HighlightResult, tag: str, start: int, end: int
+    ) -> None:
+        res.dynamic_spans.append((tag, start, end))
 
-    def _highlight_fenced_code_blocks(self, text: tk.Text, content: str) -> None:
+    def _highlight_fenced_code_blocks(self, res: HighlightResult, content: str) -> None:
         for idx, m in enumerate(self._re_fenced_code.finditer(content)):
-            self._apply_span(text, "md_code_block", m.start(), m.end())
+            self._apply_span(res, "md_code_block", m.start(), m.end())
             block_tag = f"md_code_block_{idx}"
             body_tag = f"md_code_body_{idx}"
             lang_tag = f"md_code_lang_{idx}"
-            text.tag_add(block_tag, self._idx(m.start()), self._idx(m.end()))
+            self._add_dynamic(res, block_tag, m.start(), m.end())
             body_start = m.start("body")
             body_end = m.end("body")
             if body_start is not None and body_end is not None:
-                text.tag_add(body_tag, self._idx(body_start), self._idx(body_end))
+                self._add_dynamic(res, body_tag, body_start, body_end)
             lang_start = m.start("lang")
             lang_end = m.end("lang")
             lang_raw = (m.group("lang") or "").strip()
+            res.fences.append((m.start(), m.end(), body_start, body_end, lang_raw))
             if lang_start is not None and lang_end is not None and lang_raw:
                 lang_full = m.group("lang")
                 ltrim = len(lang_full) - len(lang_full.lstrip())
                 rtrim = len(lang_full) - len(lang_full.rstrip())
                 lang_s = lang_start + ltrim
                 lang_e = lang_end - rtrim
-                text.tag_add(lang_tag, self._idx(lang_s), self._idx(lang_e))
-                with contextlib.suppress(Exception):
-                    text.tag_config(lang_tag, underline=True)
+                self._add_dynamic(res, lang_tag, lang_s, lang_e)
+                res.underline_tags.append(lang_tag)
             with contextlib.suppress(Exception):
-                self._highlight_code_block_tokens(text, content, m)
+                self._highlight_code_block_tokens(res, content, m)
             if (lang_raw.lower() in ("python", "py", "py3", "py2")) and (
                 body_start is not None and body_end is not None
             ):
                 run_tag = f"md_code_run_{idx}"
                 try:
                     if lang_start is not None and lang_end is not None and lang_raw:
-                        text.tag_add(run_tag, self._idx(lang_s), self._idx(lang_e))
+                        run_s, run_e = lang_s, lang_e
                     else:
-                        text.tag_add(
-                            run_tag, self._idx(body_start), self._idx(body_end)
-                        )
+                        run_s, run_e = body_start, body_end
                 except Exception:
-                    text.tag_add(run_tag, self._idx(body_start), self._idx(body_end))
+                    run_s, run_e = body_start, body_end
+                self._add_dynamic(res, run_tag, run_s, run_e)
+                # Shared tag so the UI can bind every run target once
+                self._apply_span(res, "md_code_run", run_s, run_e)
 
-                self._code_run_interactions.append(
+                res.code_runs.append(
                     CodeRunInteraction(
                         language=lang_raw.lower(),
                         block_tag=block_tag,
@@ -385,7 +617,7 @@ class MarkdownHighlighter:
                 )
 
     def _highlight_headings(
-        self, text: tk.Text, content: str
+        self, res: HighlightResult, content: str
     ) -> List[Tuple[int, int, int]]:
         heading_spans: List[Tuple[int, int, int]] = []
         for m in self._re_heading.finditer(content):
@@ -394,108 +626,424 @@ class MarkdownHighlighter:
             tag = f"md_h{level}"
             text_start = m.start(2)
             text_end = m.end(2)
-            self._apply_span(text, tag, text_start, text_end)
+            self._apply_span(res, tag, text_start, text_end)
             heading_spans.append((text_start, text_end, level))
         return heading_spans
 
     def _highlight_emphasis(
-        self, text: tk.Text, content: str
+        self, res: HighlightResult, content: str
     ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
         bold_spans: List[Tuple[int, int]] = []
         italic_spans: List[Tuple[int, int]] = []
         for m in self._re_bold_italic.finditer(content):
             start, end = m.start(2), m.end(2)
-            self._apply_span(text, "md_bold_italic", start, end)
+            self._apply_span(res, "md_bold_italic", start, end)
             bold_spans.append((start, end))
             italic_spans.append((start, end))
         for m in self._re_bold.finditer(content):
             start, end = m.start(2), m.end(2)
-            self._apply_span(text, "md_bold", start, end)
+            self._apply_span(res, "md_bold", start, end)
             bold_spans.append((start, end))
         for m in self._re_italic.finditer(content):
             grp = 1 if m.group(1) is not None else 2
             start, end = m.start(grp), m.end(grp)
-            self._apply_span(text, "md_italic", start, end)
+            self._apply_span(res, "md_italic", start, end)
             italic_spans.append((start, end))
         if bold_spans and italic_spans:
             for bs, is_ in itertools.product(bold_spans, italic_spans):
                 s = max(bs[0], is_[0])
                 e = min(bs[1], is_[1])
                 if s < e:
-                    self._apply_span(text, "md_bold_italic", s, e)
+                    self._apply_span(res, "md_bold_italic", s, e)
         return bold_spans, italic_spans
 
-    def _highlight_misc_inline(self, text: tk.Text, content: str) -> None:
+    def _highlight_misc_inline(self, res: HighlightResult, content: str) -> None:
         for m in self._re_quote.finditer(content):
-            self._apply_span(text, "md_highlight", m.start(1), m.end(1))
+            self._apply_span(res, "md_highlight", m.start(1), m.end(1))
         for m in self._re_brackets.finditer(content):
-            self._apply_span(text, "md_brackets", m.start(1), m.end(1))
+            self._apply_span(res, "md_brackets", m.start(1), m.end(1))
         for m in self._re_number.finditer(content):
-            self._apply_span(text, "md_number", m.start(), m.end())
+            self._apply_span(res, "md_number", m.start(), m.end())
         for m in self._re_strike.finditer(content):
-            self._apply_span(text, "md_strike", m.start(1), m.end(1))
+            self._apply_span(res, "md_strike", m.start(1), m.end(1))
         for m in self._re_inline_code.finditer(content):
-            self._apply_span(text, "md_inline_code", m.start(1), m.end(1))
+            self._apply_span(res, "md_inline_code", m.start(1), m.end(1))
         for m in self._re_blockquote.finditer(content):
-            self._apply_span(text, "md_blockquote", m.start(), m.end())
+            self._apply_span(res, "md_blockquote", m.start(), m.end())
 
-    def _highlight_lists(self, text: tk.Text, content: str) -> None:
+    def _highlight_lists(self, res: HighlightResult, content: str) -> None:
         for m in self._re_ul.finditer(content):
-            self._apply_span(text, "md_list_item", m.start(), m.end())
+            self._apply_span(res, "md_list_item", m.start(), m.end())
             indent_ws = m.group("indent") or ""
             level = self._indent_level(indent_ws)
             level = max(0, min(level, 6))
-            self._apply_span(text, f"md_list_lvl_{level}", m.start(), m.end())
-            self._apply_span(text, "md_ul_marker", m.start("marker"), m.end("marker"))
+            self._apply_span(res, f"md_list_lvl_{level}", m.start(), m.end())
+            self._apply_span(res, "md_ul_marker", m.start("marker"), m.end("marker"))
         for m in self._re_ol.finditer(content):
-            self._apply_span(text, "md_list_item", m.start(), m.end())
+            self._apply_span(res, "md_list_item", m.start(), m.end())
             indent_ws = m.group("indent") or ""
             level = self._indent_level(indent_ws)
             level = max(0, min(level, 6))
-            self._apply_span(text, f"md_list_lvl_{level}", m.start(), m.end())
+            self._apply_span(res, f"md_list_lvl_{level}", m.start(), m.end())
             marker_start = m.start("num")
             marker_end = m.end("num")
             with contextlib.suppress(Exception):
                 if content[marker_end : marker_end + 1] == ".":
                     marker_end += 1
-            self._apply_span(text, "md_ol_marker", marker_start, marker_end)
+            self._apply_span(res, "md_ol_marker", marker_start, marker_end)
 
-    def _highlight_links(self, text: tk.Text, content: str) -> None:
+    def _highlight_links(self, res: HighlightResult, content: str) -> None:
         for idx, m in enumerate(self._re_link.finditer(content)):
-            self._apply_span(text, "md_link_text", m.start(1), m.end(1))
-            self._apply_span(text, "md_link_url", m.start(2), m.end(2))
+            self._apply_span(res, "md_link_text", m.start(1), m.end(1))
+            self._apply_span(res, "md_link_url", m.start(2), m.end(2))
             url = m.group(2)
-            unique_tag = f"md_link_target_{idx}"
-            text.tag_add(unique_tag, self._idx(m.start(1)), self._idx(m.end(1)))
-            text.tag_add(unique_tag, self._idx(m.start(2)), self._idx(m.end(2)))
-            self._link_interactions.append(LinkInteraction(url=url, tag=unique_tag))
+            unique_tag = f"{res.link_tag_prefix}{idx}"
+            self._add_dynamic(res, unique_tag, m.start(1), m.end(1))
+            self._add_dynamic(res, unique_tag, m.start(2), m.end(2))
+            res.links.append(LinkInteraction(url=url, tag=unique_tag))
 
-    def highlight(self, text: tk.Text) -> None:
-        self.configure_tags(text)
-        self.clear(text)
-        # reset interactions
-        self._link_interactions.clear()
-        self._code_run_interactions.clear()
-        content = text.get("1.0", tk.END)
+    def scan(self, content: str) -> HighlightResult:
+        """Compute all spans for ``content`` without touching Tk.
+
+        Safe to call from a worker thread; the result is applied with apply().
+        """
+        res = HighlightResult(content=content)
         # Order matters for visual stacking and composite tags
-        self._highlight_fenced_code_blocks(text, content)
-        heading_spans = self._highlight_headings(text, content)
-        bold_spans, italic_spans = self._highlight_emphasis(text, content)
+        self._highlight_fenced_code_blocks(res, content)
+        self._scan_line_local(res, content)
+        res.indices = self._group_indices(
+            content, itertools.chain(res.spans, res.dynamic_spans)
+        )
+        return res
+
+    def _scan_line_local(self, res: HighlightResult, content: str) -> None:
+        # Everything except fenced code only ever matches within one line
+        if self._re_any_syntax.search(content) is None:
+            # Plain prose: one C-level scan instead of a dozen regex passes
+            return
+        heading_spans = self._highlight_headings(res, content)
+        bold_spans, italic_spans = self._highlight_emphasis(res, content)
         if heading_spans and italic_spans:
             for h_start, h_end, level in heading_spans:
                 for is_ in italic_spans:
                     s = max(h_start, is_[0])
                     e = min(h_end, is_[1])
                     if s < e:
-                        self._apply_span(text, f"md_h{level}_italic", s, e)
-        self._highlight_misc_inline(text, content)
-        self._highlight_lists(text, content)
-        self._highlight_links(text, content)
+                        self._apply_span(res, f"md_h{level}_italic", s, e)
+        self._highlight_misc_inline(res, content)
+        self._highlight_lists(res, content)
+        self._highlight_links(res, content)
+
+    def apply(self, text: tk.Text, res: HighlightResult) -> None:
+        """Replace the widget's markdown tags with a scan result (main thread)."""
+        self.configure_tags(text)
+        dynamic = list(dict.fromkeys(tag for tag, _s, _e in res.dynamic_spans))
+        self.clear(text, keep=set(dynamic))
+        self._tag_indices(text, res.indices)
+        with contextlib.suppress(tk.TclError):
+            for tag in res.underline_tags:
+                text.tag_config(tag, underline=True)
+        # Remember what this pass touched so the next clear() stays small
+        self._applied[id(text)] = {tag for tag, _s, _e in res.spans}
+        self._dynamic_tags[id(text)] = dynamic
+        self._last_content[id(text)] = res.content
+        self._fences[id(text)] = list(res.fences)
+        if (
+            res.links != self._link_interactions
+            or res.code_runs != self._code_run_interactions
+        ):
+            self._link_interactions = list(res.links)
+            self._code_run_interactions = list(res.code_runs)
+            self.interactions_version += 1
 
         # Ensure selection highlight remains visible over dynamic tags
         with contextlib.suppress(Exception):
             text.tag_raise("sel")
 
+    def highlight(
+        self, text: tk.Text, line_range: Optional[Tuple[int, int]] = None
+    ) -> None:
+        """Scan and apply synchronously on the calling (Tk) thread.
+
+        With ``line_range`` (1-based, inclusive) only those lines are
+        re-highlighted, unless they touch a fenced code block.
+        """
+        content = text.get("1.0", tk.END)
+        if line_range is not None and id(text) in self._last_content:
+            start, end = _line_span(content, *line_range)
+            if self._rehighlight_span(text, content, start, end):
+                return
+        self._generations[id(text)] = self._generations.get(id(text), 0) + 1
+        self.apply(text, self.scan(content))
+
+    def highlight_range(self, text: tk.Text, start: str, end: str) -> None:
+        """Re-highlight the lines between two Tk indices (see highlight())."""
+        first = int(text.index(start).split(".")[0])
+        last = int(text.index(end).split(".")[0])
+        self.highlight(text, line_range=(first, max(first, last)))
+
+    def highlight_incremental(
+        self,
+        text: tk.Text,
+        content: str,
+        lines: Optional[Tuple[int, int]] = None,
+    ) -> bool:
+        """Re-highlight only the lines that changed since the last pass.
+
+        ``lines`` (1-based, inclusive) are where the caller saw the edit
+        happen, e.g. the insert cursor's line; they are always included.
+        Returns False when a full pass is needed instead: nothing highlighted
+        yet, fenced code involved, or most of the buffer changed.
+        """
+        old_len = len(self._last_content.get(id(text), ""))
+        span = self._dirty_span(id(text), content)
+        if span is None:
+            return False
+        start, end = span
+        if lines is not None:
+            hint_start, hint_end = _line_span(content, *lines)
+            if start == end:
+                start, end = hint_start, hint_end
+            else:
+                start, end = min(start, hint_start), max(end, hint_end)
+            if end - start > len(content) // 2:
+                return False
+        if start == end:
+            return True  # unchanged
+        return self._rehighlight_span(
+            text, content, start, end, delta=len(content) - old_len
+        )
+
+    def _dirty_span(self, key: int, content: str) -> Optional[Tuple[int, int]]:
+        """Line-aligned span of ``content`` differing from the last pass."""
+        old = self._last_content.get(key)
+        if old is None:
+            return None
+        if old == content:
+            return (0, 0)
+        prefix = _common_prefix_len(old, content)
+        suffix = _common_suffix_len(old, content, min(len(old), len(content)))
+        # Repeated text makes the edit position ambiguous ("ab" -> "aab"); widen
+        # by the length change so every placement consistent with the diff is
+        # covered, since the widget's tags moved with the real edit.
+        delta = len(content) - len(old)
+        lo = max(0, min(prefix, len(content) - suffix) - abs(delta))
+        hi = min(len(content), max(prefix, len(content) - suffix) + abs(delta))
+        # Replaced lines that opened/closed a code block shift every block after
+        nl = old.find("\n", max(lo, hi - delta))
+        if "```" in old[old.rfind("\n", 0, lo) + 1 : len(old) if nl == -1 else nl]:
+            return None
+        start = content.rfind("\n", 0, lo) + 1
+        nl = content.find("\n", hi)
+        end = len(content) if nl == -1 else nl + 1
+        if end - start > len(content) // 2:
+            return None
+        return (start, end)
+
+    def _rehighlight_span(
+        self,
+        text: tk.Text,
+        content: str,
+        start: int,
+        end: int,
+        delta: Optional[int] = None,
+    ) -> bool:
+        """Redo line-local tags on content[start:end] (whole lines) in place.
+
+        ``delta`` is the length change when everything outside the span is
+        unchanged; it lets an edit inside one code block's body re-lex just
+        that block, since the cached fence extents only shift.
+        """
+        chunk = content[start:end]
+        idx = self._idx
+        s_idx, e_idx = idx(start), idx(end)
+        if "```" in chunk:
+            return False
+        key = id(text)
+        fences = self._fences.get(key) if delta is not None else None
+        block = None
+        if fences is None:
+            # Fence positions are unknown past this pass
+            self._fences.pop(key, None)
+            with contextlib.suppress(Exception):
+                if "md_code_block" in text.tag_names(s_idx):
+                    return False
+        else:
+            fences, block = self._shift_fences(fences, start, end, delta)
+            if fences is None:
+                return False
+        part = HighlightResult(
+            content=chunk,
+            link_tag_prefix=f"md_link_target_p{next(self._partial_serial)}_",
+        )
+        self._scan_line_local(part, chunk)
+
+        self.configure_tags(text)
+        applied = self._applied.setdefault(key, set())
+        dynamic = self._dynamic_tags.setdefault(key, [])
+        for tag in applied:
+            text.tag_remove(tag, s_idx, e_idx)
+        # Links never span lines, so any link touching the span lies within it;
+        # a link whose text was deleted outright is left with an empty tag.
+        stale = {
+            li.tag
+            for li in self._link_interactions
+            if text.tag_nextrange(li.tag, s_idx, e_idx) or not text.tag_ranges(li.tag)
+        }
+        if stale:
+            text.tag_delete(*stale)
+            dynamic[:] = [t for t in dynamic if t not in stale]
+        first_line = content.count("\n", 0, start) + 1
+        applied.update(
+            self._tag_indices(text, self._group_indices(chunk, part.spans, first_line))
+        )
+        self._tag_indices(
+            text, self._group_indices(chunk, part.dynamic_spans, first_line)
+        )
+        dynamic.extend(dict.fromkeys(tag for tag, _s, _e in part.dynamic_spans))
+        if stale or part.links:
+            self._link_interactions = [
+                li for li in self._link_interactions if li.tag not in stale
+            ] + part.links
+            self.interactions_version += 1
+        if block is not None:
+            self._retag_code_block(text, content, block, fences[block], applied)
+        if fences is not None:
+            self._fences[key] = fences
+        self._last_content[key] = content
+        with contextlib.suppress(Exception):
+            text.tag_raise("sel")
+        return True
+
+    @staticmethod
+    def _shift_fences(
+        fences: List[Tuple[int, int, int, int, str]],
+        start: int,
+        end: int,
+        delta: int,
+    ) -> Tuple[Optional[List[Tuple[int, int, int, int, str]]], Optional[int]]:
+        """Move cached fences past an edit of new-content lines [start, end).
+
+        Returns (None, None) when the edit reaches a fence line, else the new
+        extents and the index of the block whose body contains the edit.
+        """
+        old_end = end - delta
+        shifted: List[Tuple[int, int, int, int, str]] = []
+        block = None
+        for i, (f_s, f_e, b_s, b_e, lang) in enumerate(fences):
+            if f_e <= start:
+                shifted.append((f_s, f_e, b_s, b_e, lang))
+            elif f_s >= old_end:
+                shifted.append(
+                    (f_s + delta, f_e + delta, b_s + delta, b_e + delta, lang)
+                )
+            elif b_s <= start and old_end <= b_e and block is None:
+                shifted.append((f_s, f_e + delta, b_s, b_e + delta, lang))
+                block = i
+            else:
+                return None, None
+        return shifted, block
+
+    def _retag_code_block(
+        self,
+        text: tk.Text,
+        content: str,
+        i: int,
+        fence: Tuple[int, int, int, int, str],
+        applied: Set[str],
+    ) -> None:
+        """Restore block tags and re-lex the body of fenced block ``i``."""
+        f_s, f_e, b_s, b_e, lang = fence
+        idx = self._idx
+        text.tag_add("md_code_block", idx(f_s), idx(f_e))
+        text.tag_add(f"md_code_block_{i}", idx(f_s), idx(f_e))
+        text.tag_add(f"md_code_body_{i}", idx(b_s), idx(b_e))
+        applied.add("md_code_block")
+        for tag in _CODE_TOKEN_TAGS:
+            text.tag_remove(tag, idx(b_s), idx(b_e))
+        code_text = content[b_s:b_e]
+        if not _PYGMENTS_AVAILABLE or len(code_text) > 20000:
+            return
+        with contextlib.suppress(Exception):
+            by_tag = self._group_indices(
+                code_text,
+                _code_token_spans(lang, code_text),
+                content.count("\n", 0, b_s) + 1,
+            )
+            applied.update(self._tag_indices(text, by_tag))
+
+    def highlight_async(
+        self,
+        text: tk.Text,
+        on_applied: Callable[[], None] | None = None,
+        content: str | None = None,
+    ) -> None:
+        """Scan on the worker thread and apply the result on the Tk thread.
+
+        The content snapshot is taken here, on the Tk thread, unless the caller
+        already holds one. Results from a pass superseded by a newer call or by
+        cancel(), or whose snapshot no longer matches the widget, are discarded.
+        """
+        key = id(text)
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        previous = self._pending.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+        if content is None:
+            content = text.get("1.0", tk.END)
+        future = self._executor.submit(self.scan, content)
+        self._pending[key] = future
+
+        # The worker never touches Tk: this thread polls the future instead
+        def _poll() -> None:
+            if self._generations.get(key) != generation:
+                return
+            if not future.done():
+                with contextlib.suppress(tk.TclError):
+                    text.after(self.RESULT_POLL_MS, _poll)
+                return
+            self._pending.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            res = future.result()
+            # An edit whose <<Modified>> has not run cancel() yet would shift
+            # every span after it
+            try:
+                if text.edit_modified() and text.get("1.0", tk.END) != res.content:
+                    return
+            except tk.TclError:
+                return
+            self.apply(text, res)
+            if on_applied is not None:
+                on_applied()
+
+        with contextlib.suppress(tk.TclError):
+            text.after(self.RESULT_POLL_MS, _poll)
+
+    def cancel(self, text: tk.Text) -> None:
+        """Drop any in-flight async pass for ``text`` (e.g. after an edit)."""
+        key = id(text)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.cancel()
+
+    def forget(self, text: tk.Text) -> None:
+        """Drop the last-pass snapshot so the next pass is a full one.
+
+        Call after replacing the whole buffer: the old tags went with it.
+        """
+        self._last_content.pop(id(text), None)
+        self._fences.pop(id(text), None)
+
+    def close(self) -> None:
+        """Stop the scan worker; pending passes are dropped, not applied."""
+        self._pending.clear()
+        # Results still in flight no longer match any generation
+        self._generations.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def _indent_level(self, whitespace: str) -> int:
         """Estimate list nesting level from leading whitespace.
 
@@ -513,7 +1061,7 @@ class MarkdownHighlighter:
 
     # ---------- Code token highlighting ----------
     def _highlight_code_block_tokens(
-        self, text: tk.Text, content: str, m: re.Match
+        self, res: HighlightResult, content: str, m: re.Match
     ) -> None:
         if not _PYGMENTS_AVAILABLE:
             return
@@ -526,62 +1074,13 @@ class MarkdownHighlighter:
         if len(code_text) > 20000:
             return
         lang_raw = (m["lang"] or "").strip()
-        lexer = None
-        try:
-            if lang_raw:
-                lexer = get_lexer_by_name(lang_raw, stripall=False)
-        except Exception:
-            lexer = None
-        if lexer is None:
-            try:
-                # guess_lexer may be expensive; bound input size
-                sample = code_text[:4000]
-                lexer = guess_lexer(sample)
-            except Exception:
-                lexer = None
-        if lexer is None:
-            return
-
-        # Map pygments token to our tag
-        def tag_for(tok_type) -> str | None:
-            # Use startswith semantics via in-tree hierarchy
-            if tok_type in Token.Comment or str(tok_type).startswith("Token.Comment"):
-                return "md_code_cmt"
-            if tok_type in Token.Keyword or str(tok_type).startswith("Token.Keyword"):
-                return "md_code_kw"
-            if str(tok_type).startswith("Token.Name.Function"):
-                return "md_code_func"
-            if str(tok_type).startswith("Token.Name.Class"):
-                return "md_code_class"
-            if str(tok_type).startswith("Token.Name.Builtin"):
-                return "md_code_builtin"
-            if tok_type in Token.Name or str(tok_type).startswith("Token.Name"):
-                return "md_code_name"
-            if tok_type in Token.String or str(tok_type).startswith("Token.String"):
-                return "md_code_str"
-            if tok_type in Token.Number or str(tok_type).startswith("Token.Number"):
-                return "md_code_num"
-            if tok_type in Token.Operator or str(tok_type).startswith("Token.Operator"):
-                return "md_code_op"
-            if tok_type in Token.Punctuation or str(tok_type).startswith(
-                "Token.Punctuation"
-            ):
-                return "md_code_punc"
-            if str(tok_type).startswith("Token.Name.Decorator"):
-                return "md_code_deco"
-            return None
+        for tag, start, end in _code_token_spans(lang_raw, code_text):
+            self._apply_span(res, tag, body_start + start, body_start + end)
 
-        offset = 0
-        for tok_type, tok_text in lex(code_text, lexer):
-            if not tok_text:
-                continue
-            tag = tag_for(tok_type)
-            # Skip pure whitespace to reduce tag churn
-            if tag and not tok_text.isspace():
-                start = body_start + offset
-                end = start + len(tok_text)
-                self._apply_span(text, tag, start, end)
-            offset += len(tok_text)
+    @staticmethod
+    def reset_cache() -> None:
+        """Forget cached code-block tokenizations (e.g. after a style change)."""
+        _code_token_spans.cache_clear()
 
     def get_link_interactions(self) -> List[LinkInteraction]:
         return list(self._link_interactions)
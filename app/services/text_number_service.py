@@ -51,6 +51,17 @@ _ORDINALS = {
     "twentieth": 20,
 }
 
+# Inverse lookups (value -> word), built once at import
+_CARDINALS_INV = {v: k for k, v in _CARDINALS.items()}
+_ORDINALS_INV = {v: k for k, v in _ORDINALS.items()}
+
+# First letters of every supported number word; text without any of them cannot
+# contain a textual number, so the word regexes can be skipped entirely.
+_NUM_WORD_FIRST_CHARS = frozenset(
+    "".join(w[0] for w in (*_CARDINALS, *_ORDINALS))
+    + "".join(w[0].upper() for w in (*_CARDINALS, *_ORDINALS))
+)
+
 
 class TextNumberIncrementer:
     """Detects and increments numbers in text, including textual forms.
@@ -62,25 +73,32 @@ class TextNumberIncrementer:
     """
 
     _re_number = re.compile(r"\b(\d+)(st|nd|rd|th)?\b", flags=re.IGNORECASE)
+    # Suffix-free variant for text that cannot contain an ordinal suffix
+    _re_plain_number = re.compile(r"\b(\d+)\b")
 
     def increment(
         self, text: str, ordinal_only: bool = False, increment_text: bool = True
     ) -> str:
-        # Increment numeric forms first
-        text = self._increment_numeric(text, ordinal_only)
+        # Increment numeric forms first (only if there is a digit to find)
+        if any(ch.isdigit() for ch in text):
+            text = self._increment_numeric(text, ordinal_only)
         # Then increment textual forms
-        if increment_text:
+        if increment_text and not _NUM_WORD_FIRST_CHARS.isdisjoint(text):
             text = self._increment_textual(text, ordinal_only)
         return text
 
     def _increment_numeric(self, text: str, ordinal_only: bool) -> str:
+        lowered = text.lower()
+        if not any(sfx in lowered for sfx in ("st", "nd", "rd", "th")):
+            return self._re_plain_number.sub(
+                lambda m: str(int(m.group(1)) + 1), text
+            )
+
         def repl(m: re.Match[str]) -> str:
-            num = int(m.group(1))
-            suffix = m.group(2)
-            new_num = num + 1
-            if suffix:
+            new_num = int(m.group(1)) + 1
+            if m.group(2):
                 return f"{new_num}{self._ordinal_suffix(new_num)}"
-            return str(new_num) if ordinal_only else str(new_num)
+            return str(new_num)
 
         return self._re_number.sub(repl, text)
 
@@ -135,13 +153,11 @@ class TextNumberIncrementer:
 
     @staticmethod
     def _cardinal_word(n: int) -> str:
-        inv = {v: k for k, v in _CARDINALS.items()}
-        return inv.get(n, str(n))
+        return _CARDINALS_INV.get(n, str(n))
 
     @staticmethod
     def _ordinal_word(n: int) -> str:
-        inv = {v: k for k, v in _ORDINALS.items()}
-        base = inv.get(n)
+        base = _ORDINALS_INV.get(n)
         if base is not None:
             return base
         # Fallback: compose from numeric
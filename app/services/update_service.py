@@ -1,17 +1,29 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import io
 import json
 import os
+import re
 import shutil
 import sys
 import tempfile
 import threading
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import IO, Iterator, Optional, Tuple
+
+try:
+    # Optional dependency; fall back to stdlib urllib if missing
+    import urllib3
+
+    _URLLIB3_AVAILABLE = True
+except Exception:
+    _URLLIB3_AVAILABLE = False
 
 try:
     # Local version of the running app
@@ -19,6 +31,62 @@ try:
 except Exception:
     LOCAL_VERSION = "0.0.0"
 
+# Matches the version assignment in a remote app/__init__.py
+_VERSION_RE = re.compile(r"""^__version__\s*=\s*["']([^"']+)["']""", re.MULTILINE)
+
+_LEADING_DIGITS_RE = re.compile(r"\d*")
+
+# Archives up to this size are buffered in memory instead of a temp file
+_ZIP_MEMORY_LIMIT = 64 * 1024 * 1024
+
+# Larger chunks than shutil's default mean fewer read/write calls on big payloads
+_COPY_BUFFER_SIZE = 256 * 1024
+
+# Shared keep-alive pool so branch probes and the ZIP download reuse connections
+_POOL: Optional["urllib3.PoolManager"] = None  # type: ignore[name-defined]
+_POOL_LOCK = threading.Lock()
+
+
+def _shared_pool() -> Optional["urllib3.PoolManager"]:  # type: ignore[name-defined]
+    global _POOL
+    if not _URLLIB3_AVAILABLE:
+        return None
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = urllib3.PoolManager(
+                maxsize=4, retries=urllib3.Retry(total=2, backoff_factor=0.2)
+            )
+        return _POOL
+
+
+# Held while zipfile is routed through ISA-L (see _isal_inflate)
+_ZIP_PATCH_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def _isal_inflate() -> Iterator[None]:
+    """Use ISA-L's SIMD DEFLATE decoder and CRC for zipfile within this block.
+
+    isal is optional and only imported here, on the update path. zipfile looks
+    its zlib/crc32 up at call time, so they are swapped for the duration of the
+    extraction and restored afterwards.
+    """
+    try:
+        from isal import isal_zlib
+    except Exception:
+        isal_zlib = None
+    if isal_zlib is None:
+        yield
+        return
+    with _ZIP_PATCH_LOCK:
+        saved = zipfile.zlib, zipfile.crc32  # type: ignore[attr-defined]
+        zipfile.zlib = isal_zlib  # type: ignore[attr-defined]
+        zipfile.crc32 = isal_zlib.crc32  # type: ignore[attr-defined]
+        try:
+            yield
+        finally:
+            zipfile.zlib, zipfile.crc32 = saved  # type: ignore[attr-defined]
+
 
 @dataclass
 class UpdateConfig:
@@ -28,20 +96,14 @@ class UpdateConfig:
     enabled: bool
 
 
+@functools.lru_cache(maxsize=32)
 def _parse_version(version: str) -> Tuple[int, ...]:
-    v = version.strip().lstrip("vV")
-    parts = []
-    for p in v.split("."):
-        num = 0
-        for ch in p:
-            if ch.isdigit():
-                num = num * 10 + int(ch)
-            else:
-                break
-        parts.append(num)
-    while len(parts) < 3:
-        parts.append(0)
-    return tuple(parts[:3])
+    # Leading digits of each dot-separated part ("3-beta" -> 3, "x" -> 0)
+    nums = tuple(
+        int(_LEADING_DIGITS_RE.match(p).group() or 0)  # type: ignore[union-attr]
+        for p in version.strip().lstrip("vV").split(".")[:3]
+    )
+    return nums + (0,) * (3 - len(nums))
 
 
 class UpdateService:
@@ -53,10 +115,21 @@ class UpdateService:
     relaunch the app.
     """
 
+    # Seconds a probe result stays fresh for the lifetime of this process
+    PROBE_TTL_SECONDS = 600.0
+    # (repo, branch) -> (monotonic timestamp, version, zip url); shared by instances
+    _probe_cache: dict[Tuple[str, Optional[str]], Tuple[float, str, str]] = {}
+    _probe_cache_lock = threading.Lock()
+
     def __init__(self, config: Optional[UpdateConfig] = None) -> None:
         if config is None:
             config = self._load_env_config()
         self.config = config
+        self._pool = _shared_pool()
+        # {url: [etag, parsed value]} for conditional GETs on the version probes
+        self._etag_cache_path = Path.home() / "markdown_notes_update_cache.json"
+        self._etag_cache: Optional[dict[str, list[str]]] = None
+        self._etag_lock = threading.Lock()
 
     def _load_env_config(self) -> UpdateConfig:
         repo = os.environ.get("NOTES_UPDATE_REPO")
@@ -72,22 +145,31 @@ class UpdateService:
             branch = None  # We'll probe main, then master
         return UpdateConfig(repo=repo, branch=branch, token=token, enabled=enabled)
 
-    def check_and_apply_update_async(self) -> None:
+    def check_and_apply_update_async(self, refresh: bool = False) -> None:
+        """Check for an update in the background.
+
+        Set ``refresh`` to bypass the in-memory probe cache.
+        """
         if not self.config.enabled:
             return
         if not self.config.repo:
             # No repository configured; nothing to do
             return
         t = threading.Thread(
-            target=self._check_and_apply_update, name="UpdateServiceThread", daemon=True
+            target=self._check_and_apply_update,
+            kwargs={"refresh": refresh},
+            name="UpdateServiceThread",
+            daemon=True,
         )
         t.start()
 
     # ---------- Core flow ----------
 
-    def _check_and_apply_update(self) -> None:
+    def _check_and_apply_update(self, refresh: bool = False) -> None:
         try:
-            remote_version, download_url = self._get_remote_version_and_zip_url()
+            remote_version, download_url = self._get_remote_version_and_zip_url(
+                refresh=refresh
+            )
             if not remote_version or not download_url:
                 return
             if _parse_version(remote_version) <= _parse_version(LOCAL_VERSION):
@@ -96,30 +178,66 @@ class UpdateService:
             extract_dir = self._download_and_extract(download_url)
             if not extract_dir:
                 return
-            # The zip contains a single root directory; use it as source
-            candidates = list(Path(extract_dir).iterdir())
-            if not candidates:
-                return
-            source_root = candidates[0]
-            # Launch updater and exit current process
-            self._launch_updater_and_exit(source_root)
+            try:
+                # The zip contains a single root directory; use it as source
+                candidates = list(Path(extract_dir).iterdir())
+                if not candidates:
+                    return
+                source_root = candidates[0]
+                # Launch updater and exit current process
+                self._launch_updater_and_exit(source_root)
+            finally:
+                # Only reached when the updater did not take over; once it has,
+                # it deletes the directory itself after installing the files
+                shutil.rmtree(extract_dir, ignore_errors=True)
         except Exception:
             # Silent failure to avoid disrupting the app
             return
 
-    def _get_remote_version_and_zip_url(self) -> Tuple[str, str]:
+    def _get_remote_version_and_zip_url(self, refresh: bool = False) -> Tuple[str, str]:
+        key = (self.config.repo or "", self.config.branch)
+        if not refresh:
+            with self._probe_cache_lock:
+                cached = self._probe_cache.get(key)
+            if cached and time.monotonic() - cached[0] < self.PROBE_TTL_SECONDS:
+                return cached[1], cached[2]
+        version, zip_url = self._probe_remote_version_and_zip_url()
+        with self._probe_cache_lock:
+            self._probe_cache[key] = (time.monotonic(), version, zip_url)
+        return version, zip_url
+
+    def _probe_remote_version_and_zip_url(self) -> Tuple[str, str]:
         repo = self.config.repo or ""
         token = self.config.token
         branches_to_try = (
             [self.config.branch] if self.config.branch else ["main", "master"]
         )
 
-        # Probe raw __version__ from branch and build codeload zip URL
-        for branch in branches_to_try:
-            version = self._fetch_remote_version_from_branch(repo, branch, token)
-            if version:
-                zip_url = f"https://codeload.github.com/{repo}/zip/refs/heads/{branch}"
-                return version, zip_url
+        # Probe every branch concurrently; results are still taken in priority
+        # order. The rate-limited releases API is only asked when none answers.
+        pool = ThreadPoolExecutor(
+            max_workers=len(branches_to_try), thread_name_prefix="UpdateProbe"
+        )
+        try:
+            branch_futures = [
+                (
+                    branch,
+                    pool.submit(
+                        self._fetch_remote_version_from_branch, repo, branch, token
+                    ),
+                )
+                for branch in branches_to_try
+            ]
+            # Probe raw __version__ from branch and build codeload zip URL
+            for branch, fut in branch_futures:
+                if version := fut.result():
+                    zip_url = (
+                        f"https://codeload.github.com/{repo}/zip/refs/heads/{branch}"
+                    )
+                    return version, zip_url
+        finally:
+            # Don't wait on lower-priority probes once one has answered
+            pool.shutdown(wait=False, cancel_futures=True)
 
         # Fallback: try latest release tag
         version, tag = self._fetch_latest_release_version_and_tag(repo, token)
@@ -128,7 +246,32 @@ class UpdateService:
             return version, zip_url
         return "", ""
 
-    # ---------- Network helpers (stdlib urllib) ----------
+    # ---------- Network helpers (urllib3 pool, stdlib urllib fallback) ----------
+
+    def _headers(self, token: Optional[str]) -> dict[str, str]:
+        headers = {"User-Agent": "Notes-Updater"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        return headers
+
+    def _pooled_get(
+        self,
+        url: str,
+        token: Optional[str],
+        timeout: float,
+        headers: Optional[dict[str, str]] = None,
+    ) -> "urllib3.BaseHTTPResponse":  # type: ignore[name-defined]
+        resp = self._pool.request(  # type: ignore[union-attr]
+            "GET",
+            url,
+            headers={**self._headers(token), **(headers or {})},
+            timeout=urllib3.Timeout(connect=4.0, read=timeout),
+            preload_content=False,
+        )
+        if resp.status >= 400:
+            resp.release_conn()
+            raise OSError(f"HTTP {resp.status} for {url}")
+        return resp
 
     def _build_request(self, url: str, token: Optional[str]) -> object:  # noqa: ANN401
         import urllib.request
@@ -140,33 +283,101 @@ class UpdateService:
         return req
 
     def _fetch_text(self, url: str, token: Optional[str], timeout: float = 8.0) -> str:
-        import urllib.request
+        text, _etag = self._fetch_text_conditional(url, token, None, timeout)
+        return text or ""
+
+    def _fetch_text_conditional(
+        self,
+        url: str,
+        token: Optional[str],
+        etag: Optional[str],
+        timeout: float = 8.0,
+    ) -> Tuple[Optional[str], str]:
+        """GET ``url`` with ``If-None-Match`` when an ETag is known.
+
+        Returns (text, etag); text is None when the server answered 304.
+        """
+        extra = {"If-None-Match": etag} if etag else {}
+        if self._pool is not None:
+            resp = self._pooled_get(url, token, timeout, headers=extra)
+            try:
+                if resp.status == 304:
+                    return None, etag or ""
+                data = resp.read()
+                new_etag = resp.headers.get("ETag", "") or ""
+            finally:
+                resp.release_conn()
+        else:
+            import urllib.error
+            import urllib.request
+
+            req = self._build_request(url, token)
+            for key, value in extra.items():
+                req.add_header(key, value)  # type: ignore[attr-defined]
+            try:
+                with contextlib.closing(
+                    urllib.request.urlopen(req, timeout=timeout)
+                ) as resp:  # noqa: S310
+                    data = resp.read()
+                    new_etag = resp.headers.get("ETag", "") or ""
+            except urllib.error.HTTPError as exc:
+                if exc.code == 304:
+                    return None, etag or ""
+                raise
+        try:
+            return data.decode("utf-8", errors="ignore"), new_etag
+        except Exception:
+            return "", new_etag
+
+    # ---------- ETag cache (persisted between launches) ----------
 
-        req = self._build_request(url, token)
-        with contextlib.closing(
-            urllib.request.urlopen(req, timeout=timeout)
-        ) as resp:  # noqa: S310
-            data = resp.read()
+    def _load_etag_cache(self) -> dict[str, list[str]]:
+        with self._etag_lock:
+            return self._load_etag_cache_locked()
+
+    def _load_etag_cache_locked(self) -> dict[str, list[str]]:
+        if self._etag_cache is None:
             try:
-                return data.decode("utf-8", errors="ignore")
+                data = json.loads(self._etag_cache_path.read_text(encoding="utf-8"))
+                self._etag_cache = data if isinstance(data, dict) else {}
             except Exception:
-                return ""
+                self._etag_cache = {}
+        return self._etag_cache
+
+    def _cached_etag(self, url: str) -> Tuple[Optional[str], str]:
+        entry = self._load_etag_cache().get(url)
+        if isinstance(entry, list) and len(entry) == 2 and entry[0]:
+            return str(entry[0]), str(entry[1])
+        return None, ""
+
+    def _store_etag(self, url: str, etag: str, value: str) -> None:
+        # Probes run concurrently; serialize updates to the dict and the file
+        with self._etag_lock:
+            cache = self._load_etag_cache_locked()
+            if etag and value:
+                cache[url] = [etag, value]
+            else:
+                cache.pop(url, None)
+            with contextlib.suppress(Exception):
+                self._etag_cache_path.write_text(json.dumps(cache), encoding="utf-8")
 
     def _fetch_remote_version_from_branch(
         self, repo: str, branch: str, token: Optional[str]
     ) -> str:
         try:
             url = f"https://raw.githubusercontent.com/{repo}/{branch}/app/__init__.py"
-            text = self._fetch_text(url, token)
+            cached_etag, cached_version = self._cached_etag(url)
+            text, etag = self._fetch_text_conditional(url, token, cached_etag)
+            if text is None:
+                # 304 Not Modified: the cached version is still current
+                return cached_version
             if not text:
                 return ""
             # Very small parse to find __version__ = "x.y.z"
-            for line in text.splitlines():
-                if "__version__" in line and "=" in line:
-                    parts = line.split("=", 1)
-                    rhs = parts[1].strip().strip("\"'")
-                    if rhs:
-                        return rhs
+            if m := _VERSION_RE.search(text):
+                version = m.group(1)
+                self._store_etag(url, etag, version)
+                return version
         except Exception:
             return ""
         return ""
@@ -176,11 +387,16 @@ class UpdateService:
     ) -> Tuple[str, str]:
         try:
             api = f"https://api.github.com/repos/{repo}/releases/latest"
-            text = self._fetch_text(api, token)
-            if not text:
-                return "", ""
-            obj = json.loads(text)
-            tag = (obj.get("tag_name") or obj.get("name") or "").strip()
+            cached_etag, cached_tag = self._cached_etag(api)
+            text, etag = self._fetch_text_conditional(api, token, cached_etag)
+            if text is None:
+                tag = cached_tag
+            else:
+                if not text:
+                    return "", ""
+                obj = json.loads(text)
+                tag = (obj.get("tag_name") or obj.get("name") or "").strip()
+                self._store_etag(api, etag, tag)
             if not tag:
                 return "", ""
             version = tag.lstrip("vV").strip()
@@ -188,31 +404,150 @@ class UpdateService:
         except Exception:
             return "", ""
 
-    def _download_and_extract(self, zip_url: str) -> Optional[Path]:
-        import urllib.request
-
-        token = self.config.token
-        with tempfile.TemporaryDirectory(prefix="notes_update_dl_") as tmp:
-            zip_path = Path(tmp) / "repo.zip"
+    @contextlib.contextmanager
+    def _open_stream(
+        self, url: str, token: Optional[str], timeout: float
+    ) -> Iterator[IO[bytes]]:
+        """Yield a readable HTTP response body (pooled when possible)."""
+        if self._pool is not None:
+            resp = self._pooled_get(url, token, timeout)
             try:
-                req = self._build_request(zip_url, token)
-                with contextlib.closing(
-                    urllib.request.urlopen(req, timeout=30.0)
-                ) as resp:  # noqa: S310
-                    with open(zip_path, "wb") as f:
-                        shutil.copyfileobj(resp, f)
-            except Exception:
-                return None
+                yield resp
+            finally:
+                resp.release_conn()
+        else:
+            import urllib.request
+
+            req = self._build_request(url, token)
+            with contextlib.closing(
+                urllib.request.urlopen(req, timeout=timeout)
+            ) as resp:  # noqa: S310
+                yield resp
+
+    def _download_archive(self, zip_url: str) -> Optional[IO[bytes]]:
+        """Download the ZIP into memory, or a temp file when it is very large."""
+        buf: IO[bytes] = io.BytesIO()
+        try:
+            with self._open_stream(zip_url, self.config.token, 30.0) as resp:
+                # codeload usually streams chunked with no Content-Length, so the
+                # memory limit is enforced while copying
+                while chunk := resp.read(_COPY_BUFFER_SIZE):
+                    buf.write(chunk)
+                    if isinstance(buf, io.BytesIO) and buf.tell() > _ZIP_MEMORY_LIMIT:
+                        spill = tempfile.TemporaryFile(prefix="notes_update_dl_")
+                        spill.write(buf.getbuffer())
+                        buf.close()
+                        buf = spill
+        except Exception:
+            buf.close()
+            return None
+        buf.seek(0)
+        return buf
 
-            extract_dir = Path(tempfile.mkdtemp(prefix="notes_update_extracted_"))
-            try:
-                with zipfile.ZipFile(zip_path) as zf:
-                    zf.extractall(extract_dir)
-            except Exception:
+    def _download_and_extract(self, zip_url: str) -> Optional[Path]:
+        archive = self._download_archive(zip_url)
+        if archive is None:
+            return None
+        extract_dir = self._make_extract_dir()
+        try:
+            with archive, _isal_inflate():
+                if isinstance(archive, io.BytesIO):
+                    self._extract_parallel(archive.getvalue(), extract_dir)
+                else:
+                    # Spilled to disk: a single shared handle, extract serially
+                    with zipfile.ZipFile(archive) as zf:
+                        zf.extractall(extract_dir)
+        except Exception:
+            with contextlib.suppress(Exception):
+                shutil.rmtree(extract_dir, ignore_errors=True)
+            return None
+        return extract_dir
+
+    def _make_extract_dir(self) -> Path:
+        """Create the extraction directory inside the install when possible.
+
+        Sharing a filesystem with the install lets the updater hardlink files
+        into place instead of copying them a second time. The directory is
+        hidden and the updater deletes it once the files are in place.
+        """
+        with contextlib.suppress(Exception):
+            return Path(
+                tempfile.mkdtemp(
+                    prefix=".notes_update_extracted_",
+                    dir=str(self._target_root()),
+                )
+            )
+        return Path(tempfile.mkdtemp(prefix="notes_update_extracted_"))
+
+    @staticmethod
+    def _target_root() -> Path:
+        return Path(__file__).resolve().parents[2]
+
+    @staticmethod
+    def _member_path(root: Path, name: str) -> Optional[Path]:
+        """Map an archive member name to a path under ``root``.
+
+        Mirrors ZipFile.extract's sanitising: drops drive letters, empty, '.'
+        and '..' components, and on Windows strips characters and trailing
+        dots the filesystem rejects. Returns None for names that resolve to
+        ``root``.
+        """
+        arcname = name.replace("/", os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        arcname = os.path.sep.join(
+            p for p in arcname.split(os.path.sep) if p not in ("", ".", "..")
+        )
+        if os.path.sep == "\\":
+            arcname = zipfile.ZipFile._sanitize_windows_name(  # noqa: SLF001
+                arcname, os.path.sep
+            )
+        return root / arcname if arcname else None
+
+    def _extract_parallel(self, data: bytes, extract_dir: Path) -> None:
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            infos = zf.infolist()
+        targets = []
+        dirs = set()
+        for info in infos:
+            target = self._member_path(extract_dir, info.filename)
+            if target is None:
+                continue
+            if info.is_dir():
+                dirs.add(target)
+            else:
+                dirs.add(target.parent)
+                targets.append((info, target))
+        # Create every directory up front so workers never race on makedirs
+        for d in sorted(dirs):
+            d.mkdir(parents=True, exist_ok=True)
+
+        # ZipFile is not thread-safe: each worker thread reads through its own
+        # ZipFile over the shared (immutable) bytes.
+        local = threading.local()
+        opened: list[zipfile.ZipFile] = []
+        opened_lock = threading.Lock()
+
+        def _extract_one(info: zipfile.ZipInfo, target: Path) -> None:
+            zf = getattr(local, "zf", None)
+            if zf is None:
+                zf = local.zf = zipfile.ZipFile(io.BytesIO(data))
+                with opened_lock:
+                    opened.append(zf)
+            with zf.open(info) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+
+        workers = min(8, os.cpu_count() or 4)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_extract_one, i, t) for i, t in targets]
+                for fut in futures:
+                    fut.result()
+        finally:
+            for zf in opened:
                 with contextlib.suppress(Exception):
-                    shutil.rmtree(extract_dir, ignore_errors=True)
-                return None
-            return extract_dir
+                    zf.close()
 
     def _launch_updater_and_exit(self, source_root: Path) -> None:
         updater_code = self._generate_updater_script()
@@ -221,7 +556,7 @@ class UpdateService:
         with open(updater_path, "w", encoding="utf-8") as f:
             f.write(updater_code)
 
-        target_root = Path(__file__).resolve().parents[2]
+        target_root = self._target_root()
         py = sys.executable or "python"
         args = [
             py,
@@ -231,7 +566,7 @@ class UpdateService:
             py,
             str(target_root / "main.py"),
         ]
-        with contextlib.suppress(Exception):
+        try:
             # Launch detached; do not wait
             import subprocess
 
@@ -241,6 +576,10 @@ class UpdateService:
             subprocess.Popen(
                 args, cwd=str(target_root), creationflags=creationflags, close_fds=False
             )
+        except Exception:
+            # No updater to hand over to: keep running and let the caller clean up
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
 
         # Give the updater a head start then exit this process
         with contextlib.suppress(Exception):
@@ -250,23 +589,77 @@ class UpdateService:
     def _generate_updater_script(self) -> str:
         # Standalone minimal updater to run in a separate Python process
         return (
-            "import os, shutil, sys, time\n"
+            "import errno, os, shutil, sys, time\n"
+            "from concurrent.futures import ThreadPoolExecutor\n"
             "from pathlib import Path\n"
             "\n"
+            "def _retry(fn, *args) -> None:\n"
+            "    for _ in range(10):\n"
+            "        try:\n"
+            "            fn(*args)\n"
+            "            return\n"
+            "        except Exception:\n"
+            "            time.sleep(0.3)\n"
+            "\n"
+            "def _fast_copy(s, d):\n"
+            "    # copyfile uses in-kernel paths (sendfile/fcopyfile) where available\n"
+            "    shutil.copyfile(str(s), str(d))\n"
+            "    shutil.copystat(str(s), str(d))\n"
+            "    return d\n"
+            "\n"
+            "def _copy_with_retry(s, d):\n"
+            "    _retry(_fast_copy, s, d)\n"
+            "    return d\n"
+            "\n"
+            "def _link(s: Path, d: Path) -> None:\n"
+            "    # Hardlink replaces the target with the extracted inode: no bytes move.\n"
+            "    # Link under a sibling name first so the installed file stays in place\n"
+            "    # until its replacement exists (os.link fails with EXDEV across disks)\n"
+            "    tmp = d.with_name(d.name + '.notes_update_tmp')\n"
+            "    try:\n"
+            "        tmp.unlink()\n"
+            "    except FileNotFoundError:\n"
+            "        pass\n"
+            "    os.link(s, tmp)\n"
+            "    try:\n"
+            "        os.replace(tmp, d)\n"
+            "    except OSError:\n"
+            "        tmp.unlink()\n"
+            "        raise\n"
+            "\n"
+            "def _place(s: Path, d: Path) -> bool:\n"
+            "    # Returns False when hardlinking is impossible for this tree\n"
+            "    try:\n"
+            "        _link(s, d)\n"
+            "    except OSError as exc:\n"
+            "        if exc.errno in (errno.EXDEV, errno.EPERM, errno.ENOTSUP):\n"
+            "            return False\n"
+            "        _retry(_fast_copy, s, d)\n"
+            "    return True\n"
+            "\n"
             "def copy_tree(src: Path, dst: Path) -> None:\n"
-            "    for root, dirs, files in os.walk(src):\n"
-            "        rel = Path(root).relative_to(src)\n"
-            "        target_dir = dst / rel\n"
-            "        target_dir.mkdir(parents=True, exist_ok=True)\n"
-            "        for name in files:\n"
-            "            s = Path(root) / name\n"
-            "            d = target_dir / name\n"
-            "            for _ in range(10):\n"
-            "                try:\n"
-            "                    shutil.copy2(s, d)\n"
-            "                    break\n"
-            "                except Exception:\n"
-            "                    time.sleep(0.3)\n"
+            "    # The parent app has exited, so use the idle cores for file I/O\n"
+            "    workers = min(32, (os.cpu_count() or 4) * 2)\n"
+            "    with ThreadPoolExecutor(max_workers=workers) as pool:\n"
+            "        for root, dirs, files in os.walk(src):\n"
+            "            rel = Path(root).relative_to(src)\n"
+            "            target_dir = dst / rel\n"
+            "            target_dir.mkdir(parents=True, exist_ok=True)\n"
+            "            futures = [\n"
+            "                pool.submit(_place, Path(root) / name, target_dir / name)\n"
+            "                for name in files\n"
+            "            ]\n"
+            "            if all([f.result() for f in futures]):\n"
+            "                continue\n"
+            "            # Different filesystem (or no hardlink support): copy everything\n"
+            "            pending = []\n"
+            "            def _submit_copy(s, d):\n"
+            "                pending.append(pool.submit(_copy_with_retry, s, d))\n"
+            "                return d\n"
+            "            shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=_submit_copy)\n"
+            "            for f in pending:\n"
+            "                f.result()\n"
+            "            return\n"
             "\n"
             "def main() -> int:\n"
             "    if len(sys.argv) < 5:\n"
@@ -287,6 +680,10 @@ class UpdateService:
             "            time.sleep(0.25)\n"
             "\n"
             "    copy_tree(source_root, target_root)\n"
+            "    # Drop the extracted archive; hardlinked files live on in the install\n"
+            "    extract_dir = source_root.parent\n"
+            "    if extract_dir.name.lstrip('.').startswith('notes_update_extracted_'):\n"
+            "        shutil.rmtree(extract_dir, ignore_errors=True)\n"
             "\n"
             "    # Relaunch application\n"
             "    try:\n"
@@ -1,7 +1,25 @@
 from __future__ import annotations
 import contextlib
+import functools
 import tkinter as tk
-from typing import Callable
+from typing import Any, Callable, Dict
+
+# Theme attribute -> fallback color for themes that lack it
+_COLOR_DEFAULTS: Dict[str, str] = {
+    "menubar_bg": "#222",
+    "menubar_fg": "#eee",
+    "menu_active_bg": "#333",
+    "menu_active_fg": "#fff",
+    "background": "#111",
+    "foreground": "#eee",
+    "caret": "#fff",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_colors(theme: Any) -> Dict[str, str]:
+    """Resolve the overlay's colors once per (hashable, frozen) theme."""
+    return {name: getattr(theme, name, dflt) for name, dflt in _COLOR_DEFAULTS.items()}
 
 
 class FindReplaceWindow(tk.Frame):
@@ -10,6 +28,11 @@ class FindReplaceWindow(tk.Frame):
     Parent should be the editor widget/container. Uses place(..., anchor="ne").
     """
 
+    CHANGE_DEBOUNCE_MS = 120
+    # (interpreter, colors) whose option database already holds our patterns;
+    # option_add appends, so re-adding on every open would pile up entries
+    _styled_for: Any = None
+
     def __init__(
         self,
         parent: tk.Misc,
@@ -21,20 +44,27 @@ class FindReplaceWindow(tk.Frame):
         on_replace_all: Callable[[str], None],
         on_close: Callable[[], None],
     ) -> None:
-        super().__init__(parent)
+        # A dedicated Tk class lets the option database style every child below
+        super().__init__(parent, class_="FindReplace")
 
         # Resolve theme from the toplevel root if available
+        theme = None
         with contextlib.suppress(Exception):
-            root = self.winfo_toplevel()
-        theme = getattr(root, "theme", None) if "root" in locals() else None
-
-        bg_main = getattr(theme, "menubar_bg", "#222")
-        fg_main = getattr(theme, "menubar_fg", "#eee")
-        bg_active = getattr(theme, "menu_active_bg", "#333")
-        fg_active = getattr(theme, "menu_active_fg", "#fff")
-        entry_bg = getattr(theme, "background", "#111")
-        entry_fg = getattr(theme, "foreground", "#eee")
-        entry_caret = getattr(theme, "caret", "#fff")
+            theme = getattr(self.winfo_toplevel(), "theme", None)
+        try:
+            colors = _resolve_colors(theme)
+        except TypeError:
+            # Unhashable custom theme object: resolve without caching
+            colors = _resolve_colors.__wrapped__(theme)
+        bg_main = colors["menubar_bg"]
+        bg_active = colors["menu_active_bg"]
+
+        # Shared styling goes into the option database once instead of being
+        # passed to (and parsed for) every child widget.
+        style_key = (id(self.tk), tuple(colors.items()))
+        if FindReplaceWindow._styled_for != style_key:
+            FindReplaceWindow._styled_for = style_key
+            self._register_options(colors)
 
         # Base container styling
         self.configure(
@@ -50,70 +80,34 @@ class FindReplaceWindow(tk.Frame):
         self._on_replace_next = on_replace_next
         self._on_replace_all = on_replace_all
         self._on_close = on_close
+        # Trailing-edge debounce for typing in the find entry
+        self._pending_after: str | None = None
 
         # Layout frame
-        container = tk.Frame(
-            self, padx=8, pady=8, bg=bg_main, bd=0, highlightthickness=0
-        )
+        container = tk.Frame(self, padx=8, pady=8, bd=0, highlightthickness=0)
         container.pack(fill=tk.BOTH, expand=True)
 
         # Top row: Find entry + controls
-        row1 = tk.Frame(container, bg=bg_main)
+        row1 = tk.Frame(container)
         row1.pack(fill=tk.X)
 
-        tk.Label(row1, text="Find:", bg=bg_main, fg=fg_main).pack(
-            side=tk.LEFT, padx=(0, 6)
-        )
-        self.find_entry = tk.Entry(
-            row1,
-            bg=entry_bg,
-            fg=entry_fg,
-            insertbackground=entry_caret,
-            relief=tk.FLAT,
-            width=28,
-        )
+        tk.Label(row1, text="Find:").pack(side=tk.LEFT, padx=(0, 6))
+        self.find_entry = tk.Entry(row1, width=28)
         self.find_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.find_entry.insert(0, initial_find or "")
         self.find_entry.icursor(tk.END)
 
-        up_btn = tk.Button(
-            row1,
-            text="▲",
-            width=3,
-            command=self._on_up,
-            bg=bg_active,
-            fg=fg_active,
-            relief=tk.FLAT,
-            padx=6,
-        )
-        up_btn.pack(side=tk.LEFT, padx=(6, 0))
-
-        down_btn = tk.Button(
-            row1,
-            text="▼",
-            width=3,
-            command=self._on_down,
-            bg=bg_active,
-            fg=fg_active,
-            relief=tk.FLAT,
-            padx=6,
-        )
-        down_btn.pack(side=tk.LEFT, padx=(6, 0))
-
-        close_btn = tk.Button(
-            row1,
-            text="✕",
-            width=3,
-            command=self._on_close_clicked,
-            bg=bg_active,
-            fg=fg_active,
-            relief=tk.FLAT,
-            padx=6,
-        )
-        close_btn.pack(side=tk.LEFT, padx=(6, 0))
+        for label, command in (
+            ("▲", self._on_up),
+            ("▼", self._on_down),
+            ("✕", self._on_close_clicked),
+        ):
+            tk.Button(row1, text=label, width=3, command=command, padx=6).pack(
+                side=tk.LEFT, padx=(6, 0)
+            )
 
         # Options
-        opts = tk.Frame(container, bg=bg_main)
+        opts = tk.Frame(container)
         opts.pack(fill=tk.X, pady=(6, 0))
         self.var_match_case = tk.BooleanVar(value=False)
         self.var_wildcards = tk.BooleanVar(value=True)
@@ -121,66 +115,33 @@ class FindReplaceWindow(tk.Frame):
             opts,
             text="Match case",
             variable=self.var_match_case,
-            bg=bg_main,
-            fg=fg_main,
-            activebackground=bg_active,
-            activeforeground=fg_active,
-            selectcolor=bg_active,
             command=self._notify_change,
         ).pack(side=tk.LEFT)
         tk.Checkbutton(
             opts,
             text="Wildcards (*, ?)",
             variable=self.var_wildcards,
-            bg=bg_main,
-            fg=fg_main,
-            activebackground=bg_active,
-            activeforeground=fg_active,
-            selectcolor=bg_active,
             command=self._notify_change,
         ).pack(side=tk.LEFT, padx=(12, 0))
 
         # Replace row
-        row2 = tk.Frame(container, bg=bg_main)
+        row2 = tk.Frame(container)
         row2.pack(fill=tk.X, pady=(6, 0))
-        tk.Label(row2, text="Replace:", bg=bg_main, fg=fg_main).pack(
-            side=tk.LEFT, padx=(0, 6)
-        )
-        self.replace_entry = tk.Entry(
-            row2,
-            bg=entry_bg,
-            fg=entry_fg,
-            insertbackground=entry_caret,
-            relief=tk.FLAT,
-            width=28,
-        )
+        tk.Label(row2, text="Replace:").pack(side=tk.LEFT, padx=(0, 6))
+        self.replace_entry = tk.Entry(row2, width=28)
         self.replace_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-        rnext_btn = tk.Button(
-            row2,
-            text="Replace next",
-            command=self._on_replace_next_clicked,
-            bg=bg_active,
-            fg=fg_active,
-            relief=tk.FLAT,
-            padx=8,
-        )
-        rnext_btn.pack(side=tk.LEFT, padx=(6, 0))
-
-        rall_btn = tk.Button(
-            row2,
-            text="Replace all",
-            command=self._on_replace_all_clicked,
-            bg=bg_active,
-            fg=fg_active,
-            relief=tk.FLAT,
-            padx=8,
-        )
-        rall_btn.pack(side=tk.LEFT, padx=(6, 0))
+        for label, command in (
+            ("Replace next", self._on_replace_next_clicked),
+            ("Replace all", self._on_replace_all_clicked),
+        ):
+            tk.Button(row2, text=label, command=command, padx=8).pack(
+                side=tk.LEFT, padx=(6, 0)
+            )
 
         # Bindings
-        self.find_entry.bind("<KeyRelease>", lambda _e: self._notify_change())
-        self.find_entry.bind("<Return>", lambda _e: self._on_down())
+        self.find_entry.bind("<KeyRelease>", lambda _e: self._schedule_change())
+        self.find_entry.bind("<Return>", lambda _e: self._on_find_return())
         self.replace_entry.bind("<Return>", lambda _e: self._on_replace_next_clicked())
         self.bind("<Escape>", lambda _e: self._on_close_clicked())
 
@@ -195,8 +156,44 @@ class FindReplaceWindow(tk.Frame):
         # Initial change notification to seed highlights
         self.after(0, self._notify_change)
 
+    def _register_options(self, colors: Dict[str, str]) -> None:
+        bg_main = colors["menubar_bg"]
+        bg_active = colors["menu_active_bg"]
+        for pattern, value in (
+            ("*FindReplace*background", bg_main),
+            ("*FindReplace*foreground", colors["menubar_fg"]),
+            ("*FindReplace*activeBackground", bg_active),
+            ("*FindReplace*activeForeground", colors["menu_active_fg"]),
+            ("*FindReplace*relief", "flat"),
+            ("*FindReplace*Checkbutton.selectColor", bg_active),
+            ("*FindReplace*Button.background", bg_active),
+            ("*FindReplace*Button.foreground", colors["menu_active_fg"]),
+            ("*FindReplace*Entry.background", colors["background"]),
+            ("*FindReplace*Entry.foreground", colors["foreground"]),
+            ("*FindReplace*Entry.insertBackground", colors["caret"]),
+        ):
+            self.option_add(pattern, value, "widgetDefault")
+
     # ----- Callbacks -----
+    def _schedule_change(self) -> None:
+        """Coalesce a burst of keystrokes into a single search."""
+        self._cancel_pending_change()
+        self._pending_after = self.after(self.CHANGE_DEBOUNCE_MS, self._notify_change)
+
+    def _cancel_pending_change(self) -> None:
+        if self._pending_after is not None:
+            with contextlib.suppress(Exception):
+                self.after_cancel(self._pending_after)
+            self._pending_after = None
+
+    def _on_find_return(self) -> None:
+        # Commit any pending query before moving to the next match
+        if self._pending_after is not None:
+            self._notify_change()
+        self._on_down()
+
     def _notify_change(self) -> None:
+        self._cancel_pending_change()
         try:
             text = self.find_entry.get() or ""
             self._on_change(text, self.var_match_case.get(), self.var_wildcards.get())
@@ -219,6 +216,10 @@ class FindReplaceWindow(tk.Frame):
         with contextlib.suppress(Exception):
             self._on_replace_all(self.replace_entry.get() or "")
 
+    def destroy(self) -> None:
+        self._cancel_pending_change()
+        super().destroy()
+
     def _on_close_clicked(self) -> None:
         try:
             self._on_close()
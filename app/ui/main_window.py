@@ -1,15 +1,21 @@
 from __future__ import annotations
 import contextlib
+from concurrent.futures import Future, ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog
+import heapq
+import os
+import queue
+import sys
 import threading
+import time
 from tkinter import ttk
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Callable, Optional, Dict, List, Tuple
 
 from app.models.note import Note
 from app.services.file_service import FileService
-from app.services.markdown_highlighter import MarkdownHighlighter
+from app.services.markdown_highlighter import CodeRunInteraction, MarkdownHighlighter
 from app.services.link_handler import LinkHandler
 from app.services.code_runner import CodeRunner
 from app.services.equation_formatter import EquationAutoFormatter
@@ -30,9 +36,36 @@ from app.services.global_paste_listener import GlobalPasteListener
 from app.services.global_macro_recorder import GlobalMacroRecorder
 
 
+class _TreePayload:
+    """What a sidebar row stands for; unused fields stay empty strings."""
+
+    __slots__ = ("type", "id", "path", "index")
+
+    def __init__(
+        self, type: str, id: str = "", path: str = "", index: str = ""
+    ) -> None:
+        self.type = type
+        self.id = id
+        self.path = path
+        self.index = index
+
+
+# Stand-in for rows without a payload, so lookups need no None checks
+_NO_PAYLOAD = _TreePayload("")
+
+
 class MainWindow(tk.Tk):
     """Main application window with a minimal editor and Save/Open actions."""
 
+    # Stateless, so every window in the process can share one
+    _CODE_RUNNER: Optional[CodeRunner] = None
+
+    @classmethod
+    def _shared_code_runner(cls) -> CodeRunner:
+        if cls._CODE_RUNNER is None:
+            cls._CODE_RUNNER = CodeRunner()
+        return cls._CODE_RUNNER
+
     def __init__(
         self,
         file_service: FileService,
@@ -50,15 +83,66 @@ class MainWindow(tk.Tk):
         self.theme = theme
         self.highlighter = MarkdownHighlighter(debounce_ms=20, theme=self.theme)
         self.link_handler = LinkHandler()
-        self.code_runner = CodeRunner()
+        # Short background I/O jobs (opening links, listing drafts)
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="notes-io")
+        self.code_runner = self._shared_code_runner()
+        # Snippet runs block for up to the runner timeout, so they get their own
+        # warm worker instead of a new thread per click or an I/O pool slot
+        self._code_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="notes-code"
+        )
+        # Draft writes and clears, in order, off the Tk thread
+        self._draft_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="notes-draft"
+        )
+        self._draft_write: Optional[Future] = None
+        # (text, byte size) of the draft file as last written; worker-only
+        self._draft_on_disk: Optional[Tuple[str, int]] = None
+        # Set by the draft worker when a write fails; read on the next flush
+        self._draft_write_failed = threading.Event()
+        # In-flight runs by block tag; their output streams into the note
+        self._code_runs: Dict[str, Future] = {}
         self.eq_formatter = EquationAutoFormatter()
         self.list_autofill = ListAutoFill()
-        self._highlight_after_id: Optional[str] = None
+        # Timers below are tokens on the shared tick scheduler (_call_later)
+        self._tick_heap: List[Tuple[float, int, Callable[[], None]]] = []
+        self._tick_live: set[int] = set()
+        self._tick_seq: int = 0
+        self._tick_after_id: Optional[str] = None
+        self._tick_due: float = 0.0
+        self._bound_interactions_version: int = -1
+        # Per-item tag -> link URL / code run, for the delegated tag handlers
+        self._link_urls: Dict[str, str] = {}
+        self._code_run_targets: Dict[str, CodeRunInteraction] = {}
         self._dropdown: Optional[tk.Toplevel] = None
-        self._draft_after_id: Optional[str] = None
-        self._status_poll_after_id: Optional[str] = None
+        self._dropdown_items: Dict[str, List[tk.Label]] = {}
+        # One pending flush (highlight + draft save) per burst of edits or load
+        self._dirty_timer: Optional[int] = None
+        # (length, hash) of the content last highlighted / saved as draft
+        self._highlighted_sig: Optional[Tuple[int, int]] = None
+        # A highlight was skipped while the window was hidden
+        self._highlight_deferred = False
+        # Insert-cursor lines seen by <<Modified>> since the last highlight
+        self._edit_lines: Optional[Tuple[int, int]] = None
+        self._saved_sig: Optional[Tuple[int, int]] = None
+        # Edits since <<Modified>> fired that _flush_dirty has not seen yet
+        self._edit_pending = False
+        # Buffer text as of the last read; dropped on every edit (_buffer_text)
+        self._buffer_snapshot: Optional[str] = None
+        # Set by edits/loads; a clean buffer needs no snapshot to save a draft
+        self._draft_dirty = False
+        # >0 while the buffer is being replaced programmatically
+        self._suppress_modified = 0
+        self._status_poll_timer: Optional[int] = None
+        # Last strings pushed to Tk, so unchanged ones are not re-sent
+        self._shown_title = ""
+        self._shown_status = ""
+        self._shown_indicators = ""
         self.catalog = CatalogService()
         self._global_paste = GlobalPasteListener()
+        # Paste notifications from the listener thread, drained on the Tk thread
+        self._paste_events: "queue.SimpleQueue[None]" = queue.SimpleQueue()
+        self._paste_poll_timer: Optional[int] = None
         self._clipboard = ClipboardService()
         self._global_macro = GlobalMacroRecorder()
 
@@ -74,14 +158,26 @@ class MainWindow(tk.Tk):
         self.sidebar_width = 150
         self._sidebar_collapsed = False
         self._sidebar_prev_width = self.sidebar_width
-        self._sidebar_anim_after_id: Optional[str] = None
+        self._sidebar_anim_timer: Optional[int] = None
         self._sidebar_anim_token: int = 0
-        self._tree_item_to_payload: Dict[str, Dict[str, str]] = {}
+        self._tree_item_to_payload: Dict[str, _TreePayload] = {}
+        # Last rendered tree, keyed by stable node keys so refreshes can diff
+        self._tree_key_to_item: Dict[tuple, str] = {}
+        self._tree_key_to_text: Dict[tuple, str] = {}
+        self._tree_children: Dict[tuple, List[tuple]] = {}
+        self._tree_dirty: bool = False
+        # Drafts listing gathered off the Tk thread; newer gathers win
+        self._tree_drafts: List[Tuple[str, int]] = []
+        self._tree_generation: int = 0
+        # (drafts dir mtime_ns, [(path, index)]) from the last directory listing
+        self._draft_list_cache: Optional[Tuple[int, List[Tuple[Path, int]]]] = None
+        self._tree_refresh_timer: Optional[int] = None
         self._drag_item_id: Optional[str] = None
         self._drag_hover_id: Optional[str] = None
         self._tree_menu: Optional[tk.Menu] = None
 
-        # Apply theme to the root and attempt Windows dark title bar
+        # Apply theme to the root and attempt Windows dark title bar; the DWM
+        # call must land before the window first maps to avoid a light flash
         apply_theme_to_root(self, self.theme)
         apply_windows_dark_title_bar(self)
 
@@ -89,15 +185,15 @@ class MainWindow(tk.Tk):
         with contextlib.suppress(Exception):
             if loaded := self.draft_service.load_draft(self.instance_index):
                 self.current_note.body = loaded
+                # Already on disk: no need to write it back on the first autosave
+                buffered = loaded + "\n"
+                self._saved_sig = (len(buffered), hash(buffered))
         self._build_menu()
         self._build_body()
         self._build_status_bar()
-        # Attach auto-formatter bindings similar to the highlighter
-        with contextlib.suppress(Exception):
-            self.eq_formatter.attach(self.text_widget)
-        with contextlib.suppress(Exception):
-            self.list_autofill.attach(self.text_widget)
         self._bind_live_highlighting()
+        # Non-essential setup runs once the window has had its first paint
+        self.after_idle(self._finish_startup)
 
         # Editor key aliases (e.g., Ctrl+I -> Delete)
         self._bind_editor_key_aliases()
@@ -130,6 +226,55 @@ class MainWindow(tk.Tk):
         self.bind("<Control-l>", lambda e: self._toggle_list_paste())
         self.bind("<Control-L>", lambda e: self._toggle_list_paste())
 
+    # ---------- Shared timer ----------
+    def _call_later(self, delay_ms: int, callback: Callable[[], None]) -> int:
+        """Run ``callback`` after ``delay_ms`` on the shared tick; returns a token.
+
+        All window timers share one Tk ``after`` armed for the earliest due
+        entry, instead of each keeping (and cancelling) its own.
+        """
+        self._tick_seq += 1
+        token = self._tick_seq
+        due = time.perf_counter() + delay_ms / 1000.0
+        heapq.heappush(self._tick_heap, (due, token, callback))
+        self._tick_live.add(token)
+        self._arm_tick(due)
+        return token
+
+    def _cancel_later(self, token: Optional[int]) -> None:
+        # Cancelled entries stay in the heap and are skipped when they come due
+        if token is not None:
+            self._tick_live.discard(token)
+
+    def _arm_tick(self, due: float) -> None:
+        if self._tick_after_id is not None:
+            if due >= self._tick_due:
+                return
+            with contextlib.suppress(Exception):
+                self.after_cancel(self._tick_after_id)
+        self._tick_due = due
+        delay_ms = max(0, int((due - time.perf_counter()) * 1000.0 + 0.999))
+        self._tick_after_id = self.after(delay_ms, self._run_due_timers)
+
+    def _run_due_timers(self) -> None:
+        self._tick_after_id = None
+        heap = self._tick_heap
+        live = self._tick_live
+        now = time.perf_counter()
+        while heap and heap[0][0] <= now:
+            _due, token, callback = heapq.heappop(heap)
+            if token not in live:
+                continue
+            live.discard(token)
+            try:
+                callback()
+            except Exception:
+                self.report_callback_exception(*sys.exc_info())
+        while heap and heap[0][1] not in live:
+            heapq.heappop(heap)
+        if heap:
+            self._arm_tick(heap[0][0])
+
     def _build_menu(self) -> None:
         # Custom dark menu bar using a Frame + faux button that opens a custom dropdown
         self.menu_frame = tk.Frame(
@@ -137,161 +282,158 @@ class MainWindow(tk.Tk):
         )
         self.menu_frame.pack(side=tk.TOP, fill=tk.X)
 
+        # Colors shared by every menu button and dropdown item, resolved once
+        self._menu_item_opts = {
+            "bg": self.theme.menubar_bg,
+            "fg": self.theme.menubar_fg,
+        }
+        # One class binding drives hover for all of them, as plain Tcl scripts
+        # so mouseovers never call back into Python
+        self.bind_class(
+            "MenuItem",
+            "<Enter>",
+            f"%W configure -background {{{self.theme.menu_active_bg}}}",
+        )
+        self.bind_class(
+            "MenuItem",
+            "<Leave>",
+            f"%W configure -background {{{self.theme.menubar_bg}}}",
+        )
+
         self.file_btn = tk.Label(
-            self.menu_frame,
-            text="File",
-            bg=self.theme.menubar_bg,
-            fg=self.theme.menubar_fg,
-            padx=8,
-            pady=4,
+            self.menu_frame, text="File", padx=8, pady=4, **self._menu_item_opts
         )
         self.file_btn.pack(side=tk.LEFT)
         self.file_btn.bind("<Button-1>", self._open_file_dropdown)
-        self.file_btn.bind(
-            "<Enter>", lambda e: self.file_btn.configure(bg=self.theme.menu_active_bg)
-        )
-        self.file_btn.bind(
-            "<Leave>", lambda e: self.file_btn.configure(bg=self.theme.menubar_bg)
-        )
+        self._add_menu_hover(self.file_btn)
 
         # View menu for toggling sidebar when collapsed
         self.view_btn = tk.Label(
-            self.menu_frame,
-            text="View",
-            bg=self.theme.menubar_bg,
-            fg=self.theme.menubar_fg,
-            padx=8,
-            pady=4,
+            self.menu_frame, text="View", padx=8, pady=4, **self._menu_item_opts
         )
         self.view_btn.pack(side=tk.LEFT)
         self.view_btn.bind("<Button-1>", self._open_view_dropdown)
-        self.view_btn.bind(
-            "<Enter>", lambda e: self.view_btn.configure(bg=self.theme.menu_active_bg)
+        self._add_menu_hover(self.view_btn)
+
+        # Dropdowns are built once, hidden, and only re-shown on click
+        self._file_dropdown, _ = self._build_dropdown(
+            (
+                ("New", self.on_new),
+                ("Open...", self.on_open),
+                ("Save (Current File)", self.on_save_current),
+                ("Save As...", self.on_save_as),
+            )
         )
-        self.view_btn.bind(
-            "<Leave>", lambda e: self.view_btn.configure(bg=self.theme.menubar_bg)
+        self._view_dropdown, (self._view_sidebar_item,) = self._build_dropdown(
+            (("", self._toggle_sidebar),)
         )
 
         # Global click to dismiss dropdown if open
         self.bind("<Button-1>", self._on_global_click, add=True)
 
-    def _open_file_dropdown(self, _event=None) -> None:
-        # Toggle behavior
-        if self._dropdown is not None and self._dropdown.winfo_exists():
-            self._close_dropdown()
-            return
-
-        # Create borderless dropdown
-        self._dropdown = tk.Toplevel(self)
-        self._dropdown.overrideredirect(True)
-        self._dropdown.configure(bg=self.theme.menubar_bg, highlightthickness=0, bd=0)
-
-        # Position below the File button
-        bx = self.file_btn.winfo_rootx()
-        by = self.file_btn.winfo_rooty() + self.file_btn.winfo_height()
-        self._dropdown.wm_geometry(f"220x148+{bx}+{by}")
+    def _build_dropdown(self, items) -> Tuple[tk.Toplevel, List[tk.Label]]:
+        # Borderless dropdown, withdrawn until opened
+        dropdown = tk.Toplevel(self)
+        dropdown.withdraw()
+        dropdown.overrideredirect(True)
+        dropdown.configure(bg=self.theme.menubar_bg, highlightthickness=0, bd=0)
 
-        # Build menu items
         container = tk.Frame(
-            self._dropdown, bg=self.theme.menubar_bg, bd=0, highlightthickness=0
+            dropdown, bg=self.theme.menubar_bg, bd=0, highlightthickness=0
         )
         container.pack(fill=tk.BOTH, expand=True)
-
-        self._add_dropdown_item(container, "New", self.on_new)
-        self._add_dropdown_item(container, "Open...", self.on_open)
-        self._add_dropdown_item(container, "Save (Current File)", self.on_save_current)
-        self._add_dropdown_item(container, "Save As...", self.on_save_as)
+        labels = [
+            self._add_dropdown_item(container, label, command)
+            for label, command in items
+        ]
 
         # Esc closes
-        self._dropdown.bind("<Escape>", lambda e: self._close_dropdown())
-        with contextlib.suppress(Exception):
-            self._dropdown.focus_force()
+        dropdown.bind("<Escape>", lambda e: self._close_dropdown())
+        self._dropdown_items[str(dropdown)] = labels
+        return dropdown, labels
 
-    def _open_view_dropdown(self, _event=None) -> None:
+    def _show_dropdown(self, dropdown: tk.Toplevel, anchor: tk.Widget, size: str):
         # Toggle behavior
-        if self._dropdown is not None and self._dropdown.winfo_exists():
+        if self._dropdown is not None:
             self._close_dropdown()
             return
 
-        # Create borderless dropdown
-        self._dropdown = tk.Toplevel(self)
-        self._dropdown.overrideredirect(True)
-        self._dropdown.configure(bg=self.theme.menubar_bg, highlightthickness=0, bd=0)
-
-        # Position below the View button
-        bx = self.view_btn.winfo_rootx()
-        by = self.view_btn.winfo_rooty() + self.view_btn.winfo_height()
-        self._dropdown.wm_geometry(f"200x36+{bx}+{by}")
+        # Position below the menu button
+        bx = anchor.winfo_rootx()
+        by = anchor.winfo_rooty() + anchor.winfo_height()
+        dropdown.wm_geometry(f"{size}+{bx}+{by}")
+        dropdown.deiconify()
+        dropdown.lift()
+        self._dropdown = dropdown
+        with contextlib.suppress(Exception):
+            dropdown.focus_force()
 
-        # Build menu items
-        container = tk.Frame(
-            self._dropdown, bg=self.theme.menubar_bg, bd=0, highlightthickness=0
-        )
-        container.pack(fill=tk.BOTH, expand=True)
+    def _open_file_dropdown(self, _event=None) -> None:
+        self._show_dropdown(self._file_dropdown, self.file_btn, "220x148")
 
+    def _open_view_dropdown(self, _event=None) -> None:
         accel = " (Ctrl+B)"
         label = ("Show Sidebar" if self._sidebar_collapsed else "Hide Sidebar") + accel
-        self._add_dropdown_item(container, label, self._toggle_sidebar)
+        self._view_sidebar_item.configure(text=label)
+        self._show_dropdown(self._view_dropdown, self.view_btn, "200x36")
 
-        # Esc closes
-        self._dropdown.bind("<Escape>", lambda e: self._close_dropdown())
-        with contextlib.suppress(Exception):
-            self._dropdown.focus_force()
-
-    def _add_dropdown_item(self, parent: tk.Misc, label: str, command) -> None:
-        item = tk.Frame(parent, bg=self.theme.menubar_bg, height=28)
-        item.pack(fill=tk.X)
-        txt = tk.Label(
-            item,
-            text=label,
-            bg=self.theme.menubar_bg,
-            fg=self.theme.menubar_fg,
-            anchor="w",
-            padx=10,
-        )
+    def _add_dropdown_item(self, parent: tk.Misc, label: str, command) -> tk.Label:
+        txt = tk.Label(parent, text=label, anchor="w", padx=10, **self._menu_item_opts)
         txt.pack(fill=tk.X)
 
         def on_click(_e=None):
             self._close_dropdown()
             command()
 
-        item.bind("<Button-1>", on_click)
         txt.bind("<Button-1>", on_click)
-        item.bind(
-            "<Enter>",
-            lambda e: (
-                item.configure(bg=self.theme.menu_active_bg),
-                txt.configure(bg=self.theme.menu_active_bg),
-            ),
-        )
-        item.bind(
-            "<Leave>",
-            lambda e: (
-                item.configure(bg=self.theme.menubar_bg),
-                txt.configure(bg=self.theme.menubar_bg),
-            ),
-        )
+        self._add_menu_hover(txt)
+        return txt
+
+    @staticmethod
+    def _add_menu_hover(widget: tk.Misc) -> None:
+        tags = list(widget.bindtags())
+        tags.insert(1, "MenuItem")
+        widget.bindtags(tuple(tags))
 
     def _close_dropdown(self) -> None:
         if self._dropdown is not None:
             with contextlib.suppress(Exception):
-                self._dropdown.destroy()
+                self._dropdown.withdraw()
+                # No <Leave> arrives once hidden; clear any hover highlight
+                for txt in self._dropdown_items.get(str(self._dropdown), ()):
+                    txt.configure(bg=self.theme.menubar_bg)
             self._dropdown = None
 
     def _on_global_click(self, event) -> None:
         # Close if clicking outside the dropdown and outside the File button
         if self._dropdown is None:
             return
-        widget = self.winfo_containing(event.x_root, event.y_root)
+        # The press is delivered to the widget under the pointer; only hit-test
+        # again when it landed on the root itself
+        widget = event.widget
+        if widget is self or not isinstance(widget, tk.Misc):
+            widget = self.winfo_containing(event.x_root, event.y_root)
         if widget is None:
             self._close_dropdown()
             return
-        if widget is self._dropdown or str(widget).startswith(str(self._dropdown)):
-            return
-        if widget is self.file_btn or str(widget).startswith(str(self.file_btn)):
+        if self._is_within(widget, self._dropdown) or self._is_within(
+            widget, self.file_btn
+        ):
             return
         self._close_dropdown()
 
+    CLICK_ANCESTOR_DEPTH = 10
+
+    def _is_within(self, widget, ancestor) -> bool:
+        # Walk the master chain (bounded) rather than comparing path strings
+        for _ in range(self.CLICK_ANCESTOR_DEPTH):
+            if widget is ancestor:
+                return True
+            widget = getattr(widget, "master", None)
+            if widget is None:
+                return False
+        return False
+
     def _build_body(self) -> None:
         # Root body frame
         self.body = tk.Frame(self, bg=self.theme.background)
@@ -362,10 +504,12 @@ class MainWindow(tk.Tk):
             style="Dark.Vertical.TScrollbar",
         )
         self.tree.configure(yscrollcommand=vsb.set)
+        self._tree_vsb = vsb
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         vsb.pack(side=tk.RIGHT, fill=tk.Y)
 
         self.tree.bind("<Double-1>", self._on_tree_double_click)
+        self.tree.bind("<<TreeviewOpen>>", self._on_tree_open)
         self.tree.bind("<ButtonPress-1>", self._on_tree_button_press)
         self.tree.bind("<B1-Motion>", self._on_tree_drag_motion)
         self.tree.bind("<ButtonRelease-1>", self._on_tree_button_release)
@@ -387,7 +531,8 @@ class MainWindow(tk.Tk):
             borderwidth=0,
         )
         self.text_widget.pack(fill=tk.BOTH, expand=True)
-        self.text_widget.insert("1.0", self.current_note.body)
+        # Loads like any other note: no edit event, and the text is cached
+        self._set_body(self.current_note.body)
 
         self._refresh_tree()
 
@@ -404,7 +549,7 @@ class MainWindow(tk.Tk):
             with contextlib.suppress(Exception):
                 self._set_clipboard_text(first)
             # Start listening for global paste after clipboard is seeded
-            self._global_paste.start(self._on_global_paste)
+            self._start_global_paste()
             # Dismiss overlay if present
             with contextlib.suppress(Exception):
                 if hasattr(self, "_quick_overlay") and self._quick_overlay is not None:
@@ -475,7 +620,7 @@ class MainWindow(tk.Tk):
             return
 
         try:
-            content = self.text_widget.get("1.0", tk.END)
+            content = self._buffer_text()
         except Exception:
             content = ""
 
@@ -485,11 +630,11 @@ class MainWindow(tk.Tk):
             self._find_match_case,
             self._find_use_wildcards,
         )
-        for start, end in self._find_matches:
-            with contextlib.suppress(Exception):
-                self.text_widget.tag_add(
-                    "md_find_match", self._idx_chars(start), self._idx_chars(end)
-                )
+        # One variadic tag_add for all matches, guarded once for the batch
+        indices = [self._idx_chars(pos) for span in self._find_matches for pos in span]
+        if indices:
+            with contextlib.suppress(tk.TclError):
+                self.text_widget.tag_add("md_find_match", *indices)
         with contextlib.suppress(Exception):
             self.text_widget.tag_raise("md_find_match")
             self.text_widget.tag_raise("sel")
@@ -612,24 +757,49 @@ class MainWindow(tk.Tk):
                 self.text_widget.insert(start_idx, repl)
         self._apply_find_highlights()
 
+    PASTE_POLL_MS = 20
+
+    def _start_global_paste(self) -> None:
+        self._global_paste.start(self._on_global_paste)
+        if self._paste_poll_timer is None:
+            self._paste_poll_timer = self._call_later(
+                self.PASTE_POLL_MS, self._drain_paste_events
+            )
+
     def _on_global_paste(self) -> None:
-        # Called from background thread in pynput; schedule back to Tk main thread
-        def _process():
-            try:
-                cur = self.clipboard_get()
-            except Exception:
-                cur = ""
-            decision = self._clipboard.compute_next_clipboard(cur)
-            if decision.next_text is not None:
-                with contextlib.suppress(Exception):
-                    self._set_clipboard_text(decision.next_text)
-            if decision.should_stop_listener:
-                self._global_paste.stop()
-            # Refresh status label in case list mode ended automatically
-            self._update_list_paste_label()
+        # Called from background thread in pynput; only enqueue, never touch Tk
+        self._paste_events.put(None)
+
+    def _drain_paste_events(self) -> None:
+        self._paste_poll_timer = None
+        pending = False
+        with contextlib.suppress(queue.Empty):
+            while True:
+                self._paste_events.get_nowait()
+                pending = True
+        # A burst of pastes landed before we could advance the clipboard, so
+        # they all pasted the same value: advance once for the whole burst
+        if pending:
+            self._process_global_paste()
+        # Keep polling only while the listener can still produce events
+        if self._global_paste.is_active or not self._paste_events.empty():
+            self._paste_poll_timer = self._call_later(
+                self.PASTE_POLL_MS, self._drain_paste_events
+            )
 
-        with contextlib.suppress(Exception):
-            self.after(0, _process)
+    def _process_global_paste(self) -> None:
+        try:
+            cur = self.clipboard_get()
+        except Exception:
+            cur = ""
+        decision = self._clipboard.compute_next_clipboard(cur)
+        if decision.next_text is not None:
+            with contextlib.suppress(Exception):
+                self._set_clipboard_text(decision.next_text)
+        if decision.should_stop_listener:
+            self._global_paste.stop()
+        # Refresh status label in case list mode ended automatically
+        self._update_list_paste_label()
 
     def _init_tree_style(self) -> None:
         with contextlib.suppress(Exception):
@@ -657,43 +827,213 @@ class MainWindow(tk.Tk):
                 arrowcolor=self.theme.menubar_fg,
             )
 
+    TREE_REFRESH_DELAY_MS = 50
+    TREE_POLL_MS = 10
+
     def _refresh_tree(self) -> None:
-        self._tree_item_to_payload.clear()
-        for item in self.tree.get_children(""):
-            self.tree.delete(item)
+        """Mark the sidebar tree dirty; rebuilds within a short window coalesce."""
+        self._tree_dirty = True
+        # A collapsed sidebar is invisible; catch up when it is expanded again
+        if self._sidebar_collapsed:
+            return
+        if self._tree_refresh_timer is None:
+            self._tree_refresh_timer = self._call_later(
+                self.TREE_REFRESH_DELAY_MS, self._refresh_tree_now
+            )
+
+    def _refresh_tree_now(self) -> None:
+        self._cancel_later(self._tree_refresh_timer)
+        self._tree_refresh_timer = None
+        if not self._tree_dirty or self._sidebar_collapsed:
+            return
+        self._tree_dirty = False
+        self._tree_generation += 1
+        generation = self._tree_generation
+
+        # Directory listing may stall on slow disks; keep it off the Tk thread
+        # and collect the result from here rather than letting the worker call in
+        fut = self._io_pool.submit(self._list_drafts)
+
+        def _collect() -> None:
+            if generation != self._tree_generation:
+                return  # a newer gather is on its way
+            if not fut.done():
+                self._call_later(self.TREE_POLL_MS, _collect)
+                return
+            if not fut.cancelled() and fut.exception() is None:
+                self._apply_tree_snapshot(generation, fut.result())
+
+        self._call_later(self.TREE_POLL_MS, _collect)
+
+    def _apply_tree_snapshot(
+        self, generation: int, drafts: List[Tuple[str, int]]
+    ) -> None:
+        if generation != self._tree_generation:
+            return  # a newer gather is on its way
+        self._tree_drafts = drafts
+        self._render_tree()
+
+    def _render_tree(self) -> None:
+        nodes, children = self._tree_snapshot(self._tree_drafts)
+        # Detach the scrollbar while rows change so it is updated once, not
+        # after every insert/move/delete
+        yscroll = self.tree.cget("yscrollcommand")
+        self.tree.configure(yscrollcommand="")
+        try:
+            self._apply_tree_diff(nodes, children)
+        except tk.TclError:
+            # Rendered state drifted from the cache: rebuild from scratch
+            for item in self.tree.get_children(""):
+                self.tree.delete(item)
+            self._tree_key_to_item.clear()
+            self._tree_key_to_text.clear()
+            self._tree_children.clear()
+            self._tree_item_to_payload.clear()
+            self._apply_tree_diff(nodes, children)
+        finally:
+            self.tree.configure(yscrollcommand=yscroll)
+            with contextlib.suppress(Exception):
+                self._tree_vsb.set(*self.tree.yview())
+
+    def _tree_snapshot(
+        self, drafts: List[Tuple[str, int]]
+    ) -> Tuple[Dict[tuple, Tuple[tuple, str, _TreePayload]], Dict[tuple, List[tuple]]]:
+        """Describe the desired tree as stable key -> (parent key, text, payload).
+
+        Also returns the ordered child keys of every node; ``()`` is the root.
+        """
+        nodes: Dict[tuple, Tuple[tuple, str, _TreePayload]] = {}
+        children: Dict[tuple, List[tuple]] = {(): []}
+
+        def add(key: tuple, parent: tuple, text: str, payload: _TreePayload) -> None:
+            if key in nodes:
+                return
+            nodes[key] = (parent, text, payload)
+            children[parent].append(key)
+            children[key] = []
+
         # Drafts root
-        drafts_root = self.tree.insert("", "end", text="Drafts", open=True)
-        self._tree_item_to_payload[drafts_root] = {"type": "drafts_root"}
-        for draft_item, draft_index in self._list_drafts():
-            node_id = self.tree.insert(drafts_root, "end", text=draft_item, open=False)
-            self._tree_item_to_payload[node_id] = {
-                "type": "draft",
-                "index": str(draft_index),
-            }
+        add(("drafts",), (), "Drafts", _TreePayload("drafts_root"))
+        for draft_item, draft_index in drafts:
+            add(
+                ("draft", draft_index),
+                ("drafts",),
+                draft_item,
+                _TreePayload("draft", index=str(draft_index)),
+            )
         # User folders
         for folder in self.catalog.list_folders():
-            fid = self.tree.insert("", "end", text=folder.name, open=True)
-            self._tree_item_to_payload[fid] = {"type": "folder", "id": folder.id}
+            fkey = ("folder", folder.id)
+            add(fkey, (), folder.name, _TreePayload("folder", id=folder.id))
+            if folder.files and self._is_tree_folder_collapsed(fkey):
+                # Collapsed folders get a placeholder; rows load on expand
+                add(
+                    ("placeholder", folder.id),
+                    fkey,
+                    "…",
+                    _TreePayload("placeholder", id=folder.id),
+                )
+                continue
             for f in folder.files:
-                leaf = self.tree.insert(fid, "end", text=Path(f.path).name)
-                self._tree_item_to_payload[leaf] = {"type": "file", "path": f.path}
+                add(
+                    ("file", f.path),
+                    fkey,
+                    f.display_name,
+                    _TreePayload("file", path=f.path),
+                )
+        return nodes, children
+
+    def _is_tree_folder_collapsed(self, key: tuple) -> bool:
+        item = self._tree_key_to_item.get(key)
+        if item is None:
+            return False  # new folders are inserted expanded
+        try:
+            return not self.tree.tk.getboolean(self.tree.item(item, "open"))
+        except Exception:
+            return False
+
+    def _on_tree_open(self, _event=None) -> None:
+        item = self.tree.focus()
+        payload = self._tree_item_to_payload.get(item, _NO_PAYLOAD)
+        if payload.type != "folder":
+            return
+        if ("placeholder", payload.id) not in self._tree_key_to_item:
+            return
+        # <<TreeviewOpen>> fires before the item opens; open it so the
+        # snapshot materializes its files, then swap out the placeholder now
+        self.tree.item(item, open=True)
+        self._render_tree()
+
+    def _apply_tree_diff(
+        self,
+        nodes: Dict[tuple, Tuple[tuple, str, _TreePayload]],
+        children: Dict[tuple, List[tuple]],
+    ) -> None:
+        """Bring the Treeview in line with ``nodes`` touching only changed rows.
+
+        Existing rows keep their iid, so open state, selection and scroll
+        position survive a refresh.
+        """
+        items = self._tree_key_to_item
+        texts = self._tree_key_to_text
+        payloads = self._tree_item_to_payload
+        # Insert new rows (parents precede children) and relabel changed ones
+        for key, (parent, text, payload) in nodes.items():
+            item = items.get(key)
+            if item is None:
+                item = items[key] = self.tree.insert(
+                    items.get(parent, ""),
+                    "end",
+                    text=text,
+                    open=key[0] in ("drafts", "folder"),
+                )
+            elif texts.get(key) != text:
+                self.tree.item(item, text=text)
+            texts[key] = text
+            payloads[item] = payload
+        # Reorder/reparent only where a node's child list changed
+        for parent, kids in children.items():
+            if kids != self._tree_children.get(parent, []):
+                self.tree.set_children(items.get(parent, ""), *(items[k] for k in kids))
+        # Drop rows that are gone; survivors were moved out above
+        for key in [k for k in items if k not in nodes]:
+            texts.pop(key, None)
+            self._delete_tree_item(items.pop(key))
+        self._tree_children = children
+
+    def _delete_tree_item(self, item: str) -> None:
+        """Delete a row and forget its payload in one place."""
+        self._tree_item_to_payload.pop(item, None)
+        if self.tree.exists(item):
+            self.tree.delete(item)
 
     def _list_drafts(self):
         base = self.draft_service.base_dir
         results = []
-        with contextlib.suppress(Exception):
-            for p in sorted(base.glob("draft_*.md")):
-                try:
-                    idx = int(p.stem.split("_")[1])
-                except Exception:
-                    continue
-                # Only list non-empty drafts
-                try:
-                    if p.read_text(encoding="utf-8").strip() == "":
+        try:
+            dir_mtime = base.stat().st_mtime_ns
+        except Exception:
+            return results
+        # Only re-glob when files were added/removed/renamed in the directory
+        cache = self._draft_list_cache
+        if cache is None or cache[0] != dir_mtime:
+            candidates = []
+            with contextlib.suppress(Exception):
+                for p in sorted(base.glob("draft_*.md")):
+                    try:
+                        candidates.append((p, int(p.stem.split("_")[1])))
+                    except Exception:
                         continue
-                except Exception:
+            self._draft_list_cache = cache = (dir_mtime, candidates)
+        for p, idx in cache[1]:
+            # Only list non-empty drafts; drafts are saved stripped, so size
+            # alone tells (content rewrites do not bump the directory mtime)
+            try:
+                if p.stat().st_size == 0:
                     continue
-                results.append((f"Draft #{idx}", idx))
+            except Exception:
+                continue
+            results.append((f"Draft #{idx}", idx))
         return results
 
     def _build_status_bar(self) -> None:
@@ -724,10 +1064,8 @@ class MainWindow(tk.Tk):
     # ---------- Sidebar toggle ----------
     def _toggle_sidebar(self) -> None:
         # cancel any previous animation
-        if self._sidebar_anim_after_id is not None:
-            with contextlib.suppress(Exception):
-                self.after_cancel(self._sidebar_anim_after_id)
-            self._sidebar_anim_after_id = None
+        self._cancel_later(self._sidebar_anim_timer)
+        self._sidebar_anim_timer = None
         # increment token so in-flight callbacks can detect staleness
         self._sidebar_anim_token += 1
         token = self._sidebar_anim_token
@@ -741,36 +1079,41 @@ class MainWindow(tk.Tk):
             target = max(150, self._sidebar_prev_width)
             self._animate_sidebar_width(target, token)
             self._sidebar_collapsed = False
+            if self._tree_dirty:
+                self._refresh_tree()
+
+    SIDEBAR_ANIM_MS = 120
+    SIDEBAR_FRAME_MS = 16
 
     def _animate_sidebar_width(
         self, target_width: int, token: Optional[int] = None
     ) -> None:
+        """Ease the sidebar to ``target_width`` over a fixed duration.
+
+        Frames are time-based, so the tick count no longer depends on the
+        distance travelled; Tk repaints between ticks on its own.
+        """
         try:
-            current = self.sidebar.winfo_width()
+            start = self.sidebar.winfo_width()
         except Exception:
-            current = self.sidebar_width
-        if current == target_width:
-            self.sidebar_width = target_width
-            self.sidebar.configure(width=target_width)
-            self._sidebar_anim_after_id = None
-            return
-        step = 12 if target_width > current else -12
-        next_width = current + step
-        if (step > 0 and next_width > target_width) or (
-            step < 0 and next_width < target_width
-        ):
-            next_width = target_width
-        self.sidebar.configure(width=next_width)
-        with contextlib.suppress(Exception):
-            self.sidebar.update_idletasks()
+            start = self.sidebar_width
+        began = time.perf_counter()
+        duration = self.SIDEBAR_ANIM_MS / 1000.0
 
-        # if token provided, ensure only latest animation continues
-        def _next():
+        def _tick():
+            # if token provided, ensure only latest animation continues
             if token is not None and token != self._sidebar_anim_token:
                 return
-            self._animate_sidebar_width(target_width, token)
+            t = min(1.0, (time.perf_counter() - began) / duration)
+            eased = 1.0 - (1.0 - t) ** 3  # ease-out cubic
+            self.sidebar.configure(width=round(start + (target_width - start) * eased))
+            if t >= 1.0:
+                self.sidebar_width = target_width
+                self._sidebar_anim_timer = None
+                return
+            self._sidebar_anim_timer = self._call_later(self.SIDEBAR_FRAME_MS, _tick)
 
-        self._sidebar_anim_after_id = self.after(10, _next)
+        _tick()
 
     # ---------- Sidebar actions ----------
     def _on_add_folder(self) -> None:
@@ -784,8 +1127,8 @@ class MainWindow(tk.Tk):
         sel = self.tree.selection()
         if not sel:
             return None
-        payload = self._tree_item_to_payload.get(sel[0], {})
-        return payload.get("id") if payload.get("type") == "folder" else None
+        payload = self._tree_item_to_payload.get(sel[0], _NO_PAYLOAD)
+        return payload.id if payload.type == "folder" else None
 
     def _on_add_files(self) -> None:
         folder_id = self._get_selected_folder_id()
@@ -806,8 +1149,8 @@ class MainWindow(tk.Tk):
     def _on_tree_drag_motion(self, event) -> None:
         if not self._drag_item_id:
             return
-        src_payload = self._tree_item_to_payload.get(self._drag_item_id, {})
-        if src_payload.get("type") != "file":
+        src_payload = self._tree_item_to_payload.get(self._drag_item_id, _NO_PAYLOAD)
+        if src_payload.type != "file":
             return
         hover = self.tree.identify_row(event.y)
         self._drag_hover_id = hover or None
@@ -816,13 +1159,11 @@ class MainWindow(tk.Tk):
         try:
             if not self._drag_item_id or not self._drag_hover_id:
                 return
-            src_payload = self._tree_item_to_payload.get(self._drag_item_id, {})
-            dst_payload = self._tree_item_to_payload.get(self._drag_hover_id, {})
-            if (
-                src_payload.get("type") == "file"
-                and dst_payload.get("type") == "folder"
-            ):
-                self.catalog.move_file(Path(src_payload["path"]), dst_payload["id"])
+            payloads = self._tree_item_to_payload
+            src_payload = payloads.get(self._drag_item_id, _NO_PAYLOAD)
+            dst_payload = payloads.get(self._drag_hover_id, _NO_PAYLOAD)
+            if src_payload.type == "file" and dst_payload.type == "folder":
+                self.catalog.move_file(Path(src_payload.path), dst_payload.id)
                 self._refresh_tree()
         finally:
             self._drag_item_id = None
@@ -834,13 +1175,13 @@ class MainWindow(tk.Tk):
             return
         with contextlib.suppress(Exception):
             self.tree.selection_set(row)
-        payload = self._tree_item_to_payload.get(row, {})
+        payload = self._tree_item_to_payload.get(row, _NO_PAYLOAD)
         menu = tk.Menu(
             self, tearoff=0, bg=self.theme.menubar_bg, fg=self.theme.menubar_fg
         )
-        ptype = payload.get("type")
+        ptype = payload.type
         if ptype == "folder":
-            fid = payload.get("id", "")
+            fid = payload.id
             menu.add_command(
                 label="Rename Folder", command=lambda: self._on_rename_folder(fid)
             )
@@ -848,7 +1189,7 @@ class MainWindow(tk.Tk):
                 label="Delete Folder", command=lambda: self._on_delete_folder(fid)
             )
         elif ptype == "file":
-            fpath = payload.get("path", "")
+            fpath = payload.path
             menu.add_command(
                 label="Rename File",
                 command=lambda: self._on_rename_file(Path(fpath)),
@@ -886,6 +1227,19 @@ class MainWindow(tk.Tk):
         self.catalog.remove_folder(folder_id)
         self._refresh_tree()
 
+    def _is_current_file(self, path: Path) -> bool:
+        current = self.current_note.file_path if self.current_note else None
+        if current is None:
+            return False
+        # Different file names can never be the same file: skip realpath()
+        if os.path.normcase(current.name) != os.path.normcase(path.name):
+            return False
+        if current == path:
+            return True
+        with contextlib.suppress(OSError):
+            return current.resolve() == path.resolve()
+        return False
+
     def _on_rename_file(self, old_path: Path) -> None:
         initial = old_path.name
         new_name = simpledialog.askstring(
@@ -901,11 +1255,7 @@ class MainWindow(tk.Tk):
             return
         with contextlib.suppress(Exception):
             self.catalog.update_file_path(old_path, new_path)
-        if (
-            self.current_note
-            and self.current_note.file_path
-            and self.current_note.file_path.resolve() == old_path.resolve()
-        ):
+        if self._is_current_file(old_path):
             self.current_note.file_path = new_path
             self.current_note.title = Note.derive_title_from_path(new_path)
             self._update_title()
@@ -924,22 +1274,32 @@ class MainWindow(tk.Tk):
             return
         with contextlib.suppress(Exception):
             self.catalog.remove_file(path)
-        if (
-            self.current_note
-            and self.current_note.file_path
-            and self.current_note.file_path.resolve() == path.resolve()
-        ):
+        if self._is_current_file(path):
             self.current_note.file_path = None
             self._update_status()
         self._refresh_tree()
 
+    def _finish_startup(self) -> None:
+        # Attach auto-formatter bindings similar to the highlighter
+        with contextlib.suppress(Exception):
+            self.eq_formatter.attach(self.text_widget)
+        with contextlib.suppress(Exception):
+            self.list_autofill.attach(self.text_widget)
+
     def _bind_live_highlighting(self) -> None:
         # Bind to Tk's modified virtual event for edits/undo/redo/paste
         self.text_widget.bind("<<Modified>>", self._on_text_modified)
-        # Initial highlight
-        self._schedule_highlight()
-        # Also schedule draft autosave on edits
-        self._schedule_draft_save()
+        self._bind_interaction_tags()
+        self.bind("<Map>", self._on_window_map, add="+")
+        # Initial highlight (and draft autosave)
+        self._schedule_refresh()
+
+    def _on_window_map(self, event) -> None:
+        # <Map> on the root also fires for every child; only the window counts
+        if event.widget is self and self._highlight_deferred:
+            self._highlight_deferred = False
+            if self._dirty_timer is None:
+                self._dirty_timer = self._call_later(0, self._flush_dirty)
 
     # ---------- Editor key aliases ----------
     def _bind_editor_key_aliases(self) -> None:
@@ -968,120 +1328,262 @@ class MainWindow(tk.Tk):
             return "break"
 
     def _on_text_modified(self, _event=None) -> None:
-        # Reset the modified flag or the event will not fire again
+        # Re-arming the flag in _flush_dirty fires <<Modified>> again, as do
+        # buffer loads; neither is a user edit
+        try:
+            if self._suppress_modified or not self.text_widget.edit_modified():
+                return
+        except tk.TclError:
+            return
+        # The flag stays set until _flush_dirty: Tk only fires <<Modified>> when
+        # it flips, so the rest of this burst of edits costs no events at all
+        self._edit_pending = True
+        self._draft_dirty = True
+        self._buffer_snapshot = None
+        # Any in-flight background scan now describes stale content
+        self.highlighter.cancel(self.text_widget)
+        self._note_edit_line()
+        # Leave an already pending flush alone instead of cancel + re-after
+        if self._dirty_timer is None:
+            self._dirty_timer = self._call_later(self.FLUSH_DELAY_MS, self._flush_dirty)
+
+    def _note_edit_line(self) -> None:
+        # Tk leaves the insert mark just after the edit (on the next line when
+        # a newline was typed), so it and the line above bound the change
         with contextlib.suppress(Exception):
-            self.text_widget.edit_modified(False)
-        self._schedule_highlight()
-        self._schedule_draft_save()
-
-    def _schedule_highlight(self) -> None:
-        if self._highlight_after_id is not None:
+            line = int(self.text_widget.index("insert").split(".")[0])
+            first, last = self._edit_lines or (line, line)
+            self._edit_lines = (max(1, min(first, line - 1)), max(last, line))
+
+    FLUSH_DELAY_MS = 150
+
+    def _buffer_text(self) -> str:
+        """The whole buffer, read from Tk at most once between edits."""
+        if self._edit_pending:
+            # Mid-burst edits raise no event, so a copy could go stale unseen
+            return self.text_widget.get("1.0", tk.END)
+        if self._buffer_snapshot is None:
+            self._buffer_snapshot = self.text_widget.get("1.0", tk.END)
+        return self._buffer_snapshot
+
+    def _flush_dirty(self) -> None:
+        """Highlight and save the draft from one snapshot, skipping no-op work."""
+        self._dirty_timer = None
+        if self._edit_pending:
+            # Re-arm <<Modified>> for the next burst before taking the snapshot
             with contextlib.suppress(Exception):
-                self.after_cancel(self._highlight_after_id)
-        self._highlight_after_id = self.after(
-            self.highlighter.debounce_ms, self._apply_highlighting
+                self.text_widget.edit_modified(False)
+            self._edit_pending = False
+            self._buffer_snapshot = None
+            self._note_edit_line()
+        content = self._buffer_text()
+        sig = (len(content), hash(content))
+        if sig != self._highlighted_sig or self._edit_lines is not None:
+            self._apply_highlighting(content)
+        self._save_draft_now(content)
+
+    def _schedule_refresh(self) -> None:
+        """Highlight and autosave after a load, on the same timer as edits."""
+        self._draft_dirty = True
+        # A pending flush reads the buffer when it fires, so just let it run
+        if self._dirty_timer is None:
+            self._dirty_timer = self._call_later(
+                self.highlighter.debounce_ms, self._flush_dirty
+            )
+
+    def _apply_highlighting(self, content: Optional[str] = None) -> None:
+        # Nobody can see the tags while minimized/unmapped; catch up on <Map>
+        try:
+            hidden = self.wm_state() == "iconic" or not self.winfo_viewable()
+        except tk.TclError:
+            hidden = False
+        if hidden:
+            self._highlight_deferred = True
+            return
+        self._highlight_deferred = False
+        if content is None:
+            content = self._buffer_text()
+        sig = (len(content), hash(content))
+        lines, self._edit_lines = self._edit_lines, None
+        if self._highlighted_sig is None and not content.strip():
+            # Blank first buffer: nothing to tag, so leave the scan worker
+            # unstarted until there is text
+            self._highlighted_sig = sig
+            return
+        # Small edits only re-tag the lines they touched, synchronously
+        if self.highlighter.highlight_incremental(
+            self.text_widget, content, lines=lines
+        ):
+            self._highlighted_sig = sig
+            self._on_highlight_applied()
+            return
+
+        def _applied() -> None:
+            self._highlighted_sig = sig
+            self._on_highlight_applied()
+
+        # Regex scanning runs on the highlighter's worker; tags land on this thread
+        self.highlighter.highlight_async(
+            self.text_widget, on_applied=_applied, content=content
         )
 
-    def _apply_highlighting(self) -> None:
-        self.highlighter.highlight(self.text_widget)
+    def _on_highlight_applied(self) -> None:
         self._bind_highlighter_interactions()
         # Re-apply find highlights above markdown tags
         self._apply_find_highlights()
-        self._highlight_after_id = None
 
     def _bind_highlighter_interactions(self) -> None:
-        # Bind link interactions (click + hover cursor)
+        # The shared tags are bound once (_bind_interaction_tags); a pass that
+        # changed links/code runs only needs the lookup tables refreshed
+        version = self.highlighter.interactions_version
+        if version == self._bound_interactions_version:
+            return
+        self._bound_interactions_version = version
+        self._link_urls = {
+            li.tag: li.url for li in self.highlighter.get_link_interactions()
+        }
+        self._code_run_targets = {
+            ci.run_tag: ci for ci in self.highlighter.get_code_run_interactions()
+        }
+
+    def _bind_interaction_tags(self) -> None:
+        # One handler per event on the static tags every link/run target carries
+        for tag, on_click in (
+            ("md_link_text", self._on_link_click),
+            ("md_link_url", self._on_link_click),
+            ("md_code_run", self._on_code_run_click),
+        ):
+            self.text_widget.tag_bind(tag, "<Button-1>", on_click)
+            self.text_widget.tag_bind(tag, "<Enter>", self._on_interaction_enter)
+            self.text_widget.tag_bind(tag, "<Leave>", self._on_interaction_leave)
+
+    def _target_at_pointer(self, targets: Dict[str, Any]) -> Any:
+        # The per-item tag under the mouse says which link/block was hit
+        with contextlib.suppress(tk.TclError):
+            for tag in self.text_widget.tag_names(tk.CURRENT):
+                hit = targets.get(str(tag))
+                if hit is not None:
+                    return hit
+        return None
+
+    def _on_interaction_enter(self, _event=None) -> None:
         with contextlib.suppress(Exception):
-            for li in self.highlighter.get_link_interactions():
-
-                def _open_link(_e=None, u=li.url):
-                    # Run in background to avoid blocking UI on slow handlers
-                    threading.Thread(
-                        target=lambda: self.link_handler.open_link(u), daemon=True
-                    ).start()
-                    return "break"
-
-                def _enter(e):
-                    with contextlib.suppress(Exception):
-                        e.widget.configure(cursor="hand2")
-
-                def _leave(e):
-                    with contextlib.suppress(Exception):
-                        e.widget.configure(cursor="")
-
-                self.text_widget.tag_bind(li.tag, "<Button-1>", _open_link)
-                self.text_widget.tag_bind(li.tag, "<Enter>", _enter)
-                self.text_widget.tag_bind(li.tag, "<Leave>", _leave)
-        # Bind code run interactions (click to execute, hover to show cursor)
+            self.text_widget.configure(cursor="hand2")
+
+    def _on_interaction_leave(self, _event=None) -> None:
         with contextlib.suppress(Exception):
-            for ci in self.highlighter.get_code_run_interactions():
+            self.text_widget.configure(cursor="")
 
-                def _enter(e):
-                    with contextlib.suppress(Exception):
-                        e.widget.configure(cursor="hand2")
+    def _on_link_click(self, _event=None) -> str:
+        url = self._target_at_pointer(self._link_urls)
+        if url is not None:
+            # Run in background to avoid blocking UI on slow handlers
+            self._io_pool.submit(self.link_handler.open_link, url)
+        return "break"
 
-                def _leave(e):
-                    with contextlib.suppress(Exception):
-                        e.widget.configure(cursor="")
+    def _on_code_run_click(self, _event=None) -> str:
+        ci = self._target_at_pointer(self._code_run_targets)
+        if ci is None:
+            return "break"
+        # Capture code text on main thread (Tk is not thread-safe)
+        try:
+            ranges = self.text_widget.tag_ranges(ci.body_tag)
+            if not ranges or len(ranges) < 2:
+                return "break"
+            code = self.text_widget.get(ranges[0], ranges[1])
+        except Exception:
+            return "break"
+        self._run_code_block(ci.block_tag, code)
+        return "break"
 
-                def _on_click(_e=None, btag=ci.block_tag, bdytag=ci.body_tag):
-                    # Capture code text on main thread (Tk is not thread-safe)
-                    try:
-                        ranges = self.text_widget.tag_ranges(bdytag)
-                        if not ranges or len(ranges) < 2:
-                            return "break"
-                        start_idx, end_idx = ranges[0], ranges[1]
-                        code = self.text_widget.get(start_idx, end_idx)
-                    except Exception:
-                        return "break"
-
-                    def _run():
-                        rc, out, err = self.code_runner.run_python(code)
-                        combined = (out or "") + (err or "")
-                        display = combined if combined.strip() else "none\n"
-                        header = MarkdownHighlighter.OUTPUT_HEADER
-                        footer = MarkdownHighlighter.OUTPUT_FOOTER
-                        payload = (
-                            header
-                            + display
-                            + ("" if display.endswith("\n") else "\n")
-                            + footer
-                        )
-
-                        def _apply():
-                            self._insert_or_replace_code_output(btag, payload)
-
-                        with contextlib.suppress(Exception):
-                            self.after(0, _apply)
-
-                    threading.Thread(target=_run, daemon=True).start()
-                    return "break"
-
-                self.text_widget.tag_bind(ci.run_tag, "<Enter>", _enter)
-                self.text_widget.tag_bind(ci.run_tag, "<Leave>", _leave)
-                self.text_widget.tag_bind(ci.run_tag, "<Button-1>", _on_click)
+    CODE_OUTPUT_POLL_MS = 50
+
+    def _run_code_block(self, block_tag: str, code: str) -> None:
+        # A block that is still running keeps streaming into its section
+        if block_tag in self._code_runs:
+            return
+        footer = MarkdownHighlighter.OUTPUT_FOOTER
+        # Open an empty output section now and stream lines in above the footer
+        self._insert_or_replace_code_output(
+            block_tag, MarkdownHighlighter.OUTPUT_HEADER + footer
+        )
+        oranges = self.text_widget.tag_ranges(f"out_{block_tag}")
+        if len(oranges) < 2:
+            return
+        mark = f"out_end_{block_tag}"
+        self.text_widget.mark_set(mark, f"{oranges[-1]}-{len(footer)}c")
+        chunks: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        fut = self._code_pool.submit(
+            self.code_runner.run_python_stream, code, chunks.put
+        )
+        self._code_runs[block_tag] = fut
+        wrote, ends_nl = False, True
+
+        def _drain() -> None:
+            nonlocal wrote, ends_nl
+            # Check completion first: every chunk is queued before it completes
+            done = fut.done()
+            parts: List[str] = []
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    parts.append(chunks.get_nowait())
+            if done:
+                exc = fut.exception()
+                if exc is not None:
+                    parts.append(f"[Runner error] {exc}")
+                if not wrote and not "".join(parts).strip():
+                    parts = ["none"]
+            text = "".join(parts)
+            if text:
+                wrote, ends_nl = True, text.endswith("\n")
+            if done and not ends_nl:
+                text += "\n"
+            if text:
+                with contextlib.suppress(tk.TclError):
+                    self.text_widget.insert(mark, text)
+            if not done:
+                self._call_later(self.CODE_OUTPUT_POLL_MS, _drain)
+                return
+            del self._code_runs[block_tag]
+            with contextlib.suppress(tk.TclError):
+                self.text_widget.mark_unset(mark)
+
+        self._call_later(self.CODE_OUTPUT_POLL_MS, _drain)
 
     def _insert_or_replace_code_output(self, block_tag: str, payload: str) -> None:
         # Insert payload after the code block; replace existing output section if present
         header = MarkdownHighlighter.OUTPUT_HEADER
         footer = MarkdownHighlighter.OUTPUT_FOOTER
+        out_tag = f"out_{block_tag}"
         with contextlib.suppress(Exception):
             branges = self.text_widget.tag_ranges(block_tag)
             if not branges or len(branges) < 2:
                 return
             block_end = branges[1]
 
-            # Delete existing output section directly below if present
-            with contextlib.suppress(Exception):
-                window = self.text_widget.get(block_end, f"{block_end}+20000c")
-                lead = 0
-                while lead < len(window) and window[lead] in "\r\n":
-                    lead += 1
-                if window[lead:].startswith(header):
-                    rel_footer = window[lead:].find(footer)
-                    if rel_footer != -1:
-                        total = lead + rel_footer + len(footer)
-                        self.text_widget.delete(block_end, f"{block_end}+{total}c")
+            # Output inserted this session is tagged; block tags are renumbered
+            # when blocks are added above, so check it still sits below this one
+            oranges = self.text_widget.tag_ranges(out_tag)
+            if (
+                len(oranges) >= 2
+                and self.text_widget.compare(oranges[0], ">=", block_end)
+                and not self.text_widget.get(block_end, oranges[0]).strip("\r\n")
+                and self.text_widget.get(oranges[0], f"{oranges[0]}+{len(header)}c")
+                == header
+            ):
+                self.text_widget.delete(block_end, oranges[-1])
+            else:
+                # Output loaded from disk: find it right below the block
+                with contextlib.suppress(Exception):
+                    window = self.text_widget.get(block_end, f"{block_end}+20000c")
+                    lead = 0
+                    while lead < len(window) and window[lead] in "\r\n":
+                        lead += 1
+                    if window[lead:].startswith(header):
+                        rel_footer = window[lead:].find(footer)
+                        if rel_footer != -1:
+                            total = lead + rel_footer + len(footer)
+                            self.text_widget.delete(block_end, f"{block_end}+{total}c")
             # Ensure newline separation
             try:
                 prev_char = self.text_widget.get(f"{block_end}-1c", block_end)
@@ -1091,8 +1593,11 @@ class MainWindow(tk.Tk):
                 self.text_widget.insert(block_end, "\n")
                 block_end = f"{block_end}+1c"
 
-            # Insert new output
-            self.text_widget.insert(block_end, payload)
+            # Insert new output and tag it for the next replace
+            start = self.text_widget.index(block_end)
+            self.text_widget.insert(start, payload)
+            self.text_widget.tag_remove(out_tag, "1.0", tk.END)
+            self.text_widget.tag_add(out_tag, start, f"{start}+{len(payload)}c")
 
     def _update_status(self) -> None:
         path_text = (
@@ -1104,8 +1609,11 @@ class MainWindow(tk.Tk):
             status = f"File: {path_text}"
         else:
             status = f"Draft slot: #{self.instance_index} (unsaved)"
+        if status == self._shown_status:
+            return
         with contextlib.suppress(Exception):
             self.status_label.configure(text=status)
+            self._shown_status = status
 
     def _refresh_status_indicators(self) -> None:
         parts = []
@@ -1120,34 +1628,83 @@ class MainWindow(tk.Tk):
         except Exception:
             pass
         text = " • ".join(parts)
+        # Polled every 300 ms but rarely changes
+        if text == self._shown_indicators:
+            return
         with contextlib.suppress(Exception):
             self.status_right_label.configure(text=text)
+            self._shown_indicators = text
 
     def _schedule_status_poll(self) -> None:
         # Poll for changes in background-driven states (macro recorder)
-        if self._status_poll_after_id is not None:
-            with contextlib.suppress(Exception):
-                self.after_cancel(self._status_poll_after_id)
+        self._cancel_later(self._status_poll_timer)
 
         def _tick():
             self._refresh_status_indicators()
-            self._status_poll_after_id = self.after(300, _tick)
+            self._status_poll_timer = self._call_later(300, _tick)
 
         # Kick off immediately
         _tick()
 
-    def _schedule_draft_save(self) -> None:
-        if self._draft_after_id is not None:
-            with contextlib.suppress(Exception):
-                self.after_cancel(self._draft_after_id)
-        # Save drafts with a small debounce to avoid excessive disk writes
-        self._draft_after_id = self.after(400, self._save_draft_now)
-
-    def _save_draft_now(self) -> None:
+    def _save_draft_now(self, content: Optional[str] = None) -> None:
+        if self._draft_write_failed.is_set():
+            # The last write never landed: retry it whatever the signature says
+            self._draft_write_failed.clear()
+            self._saved_sig = None
+            self._draft_dirty = True
+        # Nothing edited since the last save: skip copying the buffer out of Tk
+        if content is None and not self._draft_dirty:
+            return
         with contextlib.suppress(Exception):
-            text = self.text_widget.get("1.0", tk.END).rstrip()
-            self.draft_service.save_draft(self.instance_index, text)
-        self._draft_after_id = None
+            if content is None:
+                content = self._buffer_text()
+            sig = (len(content), hash(content))
+            # Unchanged since the last save: skip the write entirely
+            if sig != self._saved_sig:
+                # A write still queued behind the running one is now stale
+                if self._draft_write is not None:
+                    self._draft_write.cancel()
+                self._draft_write = self._draft_pool.submit(self._write_draft, content)
+                self._saved_sig = sig
+            self._draft_dirty = False
+
+    def _write_draft(self, text: str) -> None:
+        # Runs on the draft worker, so the stripped copy is made off the Tk
+        # thread; a failed write is retried on the next flush
+        text = text.rstrip()
+        on_disk = self._draft_on_disk
+        try:
+            size = None
+            # Writing at the end of the note only needs the new tail on disk
+            if on_disk is not None and text.startswith(on_disk[0]):
+                size = self.draft_service.append_draft(
+                    self.instance_index, text[len(on_disk[0]) :], on_disk[1]
+                )
+            if size is None:
+                path = self.draft_service.save_draft(self.instance_index, text)
+                size = path.stat().st_size
+            self._draft_on_disk = (text, size)
+        except Exception:
+            self._draft_on_disk = None
+            # Never call into Tk from here: _on_close joins this worker from
+            # the Tk thread, so a queued after() would deadlock the exit
+            self._draft_write_failed.set()
+
+    def _clear_draft(self) -> None:
+        # Queued behind pending writes so a stale one cannot recreate the file
+        self._draft_pool.submit(self._clear_draft_now)
+
+    def _clear_draft_now(self) -> None:
+        self._draft_on_disk = None
+        self.draft_service.clear_draft(self.instance_index)
+
+    def _drop_draft_for_file(self, body: str) -> None:
+        # A freshly opened file is its own backup: clear the slot rather than
+        # copy the file into it, and only write a draft once it is edited
+        with contextlib.suppress(Exception):
+            self._clear_draft()
+        buffered = body + "\n"
+        self._saved_sig = (len(buffered), hash(buffered))
 
     def _update_title(self) -> None:
         title_part = (
@@ -1155,7 +1712,10 @@ class MainWindow(tk.Tk):
             if (self.current_note and self.current_note.title)
             else "Untitled"
         )
-        self.title(f"Markdown Notes [#{self.instance_index}] - {title_part}")
+        title = f"Markdown Notes [#{self.instance_index}] - {title_part}"
+        if title != self._shown_title:
+            self.title(title)
+            self._shown_title = title
 
     # ---------- List paste (Ctrl+L) ----------
     def _toggle_list_paste(self) -> str | None:
@@ -1179,7 +1739,7 @@ class MainWindow(tk.Tk):
             return "break"
         with contextlib.suppress(Exception):
             self._set_clipboard_text(first)
-        self._global_paste.start(self._on_global_paste)
+        self._start_global_paste()
         self._update_list_paste_label()
         return "break"
 
@@ -1220,27 +1780,25 @@ class MainWindow(tk.Tk):
             return
 
         self.current_note = note
-        self.text_widget.delete("1.0", tk.END)
-        self.text_widget.insert("1.0", note.body)
+        self._set_body(note.body)
+        self._drop_draft_for_file(note.body)
         self._update_title()
-        self._schedule_highlight()
-        self._schedule_draft_save()
+        self._schedule_refresh()
         self._update_status()
 
     def on_new(self) -> None:
         self.current_note = Note(title="Untitled", body="")
-        self.text_widget.delete("1.0", tk.END)
-        self.text_widget.insert("1.0", "")
+        # Ctrl+N on an already blank buffer has nothing to highlight or save
+        if self._set_body(""):
+            self._schedule_refresh()
         self._update_title()
-        self._schedule_highlight()
-        self._schedule_draft_save()
         self._update_status()
 
     def on_save(self) -> None:
         if self.current_note is None:
             self.current_note = Note(title="Untitled", body="")
 
-        self.current_note.body = self.text_widget.get("1.0", tk.END).rstrip()
+        self.current_note.body = self._buffer_text().rstrip()
 
         try:
             # If no existing path, trigger Save As
@@ -1251,13 +1809,13 @@ class MainWindow(tk.Tk):
             messagebox.showinfo("Saved", "Note saved successfully.")
             # Clear draft upon successful save to a file
             with contextlib.suppress(Exception):
-                self.draft_service.clear_draft(self.instance_index)
+                self._clear_draft()
             self._update_status()
         except Exception as exc:
             messagebox.showerror("Save Failed", f"Could not save file:\n{exc}")
 
     def on_save_as(self) -> None:
-        self.current_note.body = self.text_widget.get("1.0", tk.END).rstrip()
+        self.current_note.body = self._buffer_text().rstrip()
         initial_name = (
             self.current_note.file_path.name
             if self.current_note and self.current_note.file_path
@@ -1282,7 +1840,7 @@ class MainWindow(tk.Tk):
             messagebox.showinfo("Saved", f"Saved to: {target}")
             # Clear draft after saving as a new file
             with contextlib.suppress(Exception):
-                self.draft_service.clear_draft(self.instance_index)
+                self._clear_draft()
             self._update_status()
         except Exception as exc:
             messagebox.showerror("Save Failed", f"Could not save file:\n{exc}")
@@ -1294,31 +1852,37 @@ class MainWindow(tk.Tk):
                 "No file is currently open. Use Save As... to choose a location.",
             )
             return
-        self.current_note.body = self.text_widget.get("1.0", tk.END).rstrip()
+        self.current_note.body = self._buffer_text().rstrip()
         try:
             target = self.file_service.write(self.current_note)
             self._update_title()
             messagebox.showinfo("Saved", f"Saved to: {target}")
             with contextlib.suppress(Exception):
-                self.draft_service.clear_draft(self.instance_index)
+                self._clear_draft()
             self._update_status()
         except Exception as exc:
             messagebox.showerror("Save Failed", f"Could not save file:\n{exc}")
 
     def _on_close(self) -> None:
         # Persist latest draft and release the instance lock before closing
+        # Drop every pending timer (draft save, flush, polls) in one go
+        self._tick_heap.clear()
+        self._tick_live.clear()
+        if self._tick_after_id is not None:
+            with contextlib.suppress(Exception):
+                self.after_cancel(self._tick_after_id)
+            self._tick_after_id = None
         with contextlib.suppress(Exception):
-            if self._draft_after_id is not None:
-                with contextlib.suppress(Exception):
-                    self.after_cancel(self._draft_after_id)
             self._save_draft_now()
-        with contextlib.suppress(Exception):
-            if self._status_poll_after_id is not None:
-                self.after_cancel(self._status_poll_after_id)
         with contextlib.suppress(Exception):
             self._global_paste.stop()
         with contextlib.suppress(Exception):
             self._global_macro.stop()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._code_pool.shutdown(wait=False, cancel_futures=True)
+        self.highlighter.close()
+        # The final draft must be on disk before the instance slot is released
+        self._draft_pool.shutdown(wait=True)
         with contextlib.suppress(Exception):
             self.draft_service.release_instance_index(self.instance_index)
         with contextlib.suppress(Exception):
@@ -1329,10 +1893,10 @@ class MainWindow(tk.Tk):
         sel = self.tree.selection()
         if not sel:
             return
-        payload = self._tree_item_to_payload.get(sel[0], {})
-        ptype = payload.get("type")
+        payload = self._tree_item_to_payload.get(sel[0], _NO_PAYLOAD)
+        ptype = payload.type
         if ptype == "file":
-            path = Path(payload.get("path", ""))
+            path = Path(payload.path)
             if not path.exists():
                 messagebox.showerror("Missing File", f"File not found:\n{path}")
                 return
@@ -1342,12 +1906,12 @@ class MainWindow(tk.Tk):
                 messagebox.showerror("Open Failed", f"Could not open file:\n{exc}")
                 return
             self.current_note = note
-            self.text_widget.delete("1.0", tk.END)
-            self.text_widget.insert("1.0", note.body)
+            self._set_body(note.body)
+            self._drop_draft_for_file(note.body)
             self.update_note()
         elif ptype == "draft":
             try:
-                idx = int(payload.get("index", "0"))
+                idx = int(payload.index or "0")
             except Exception:
                 return
             try:
@@ -1355,12 +1919,32 @@ class MainWindow(tk.Tk):
             except Exception:
                 text = ""
             self.current_note = Note(title=f"Draft #{idx}", body=text)
-            self.text_widget.delete("1.0", tk.END)
-            self.text_widget.insert("1.0", text)
+            self._set_body(text)
             self.update_note()
 
+    def _set_body(self, body: str) -> bool:
+        """Replace the whole buffer without going through the edit pipeline.
+
+        Returns False when the buffer already held ``body`` and was left alone.
+        """
+        # Re-opening what is already shown keeps the buffer and its tags
+        if not self._edit_pending and self._buffer_text() == body + "\n":
+            return False
+        self._suppress_modified += 1
+        try:
+            # One Tcl call instead of delete + insert
+            self.text_widget.replace("1.0", tk.END, body)
+            self.text_widget.edit_modified(False)
+            # The old tags went with the old text
+            self.highlighter.forget(self.text_widget)
+            self._edit_pending = False
+            # Tk always keeps one trailing newline after the text
+            self._buffer_snapshot = body + "\n"
+        finally:
+            self._suppress_modified -= 1
+        return True
+
     def update_note(self):
         self._update_title()
-        self._schedule_highlight()
-        self._schedule_draft_save()
+        self._schedule_refresh()
         self._update_status()
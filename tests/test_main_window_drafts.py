@@ -0,0 +1,79 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from app.ui.main_window import MainWindow
+
+
+class _FailingDraftService:
+    def __init__(self) -> None:
+        self.released = False
+
+    def append_draft(self, *_args):
+        raise OSError("disk full")
+
+    def save_draft(self, *_args) -> Path:
+        raise OSError("disk full")
+
+    def release_instance_index(self, _index: int) -> None:
+        self.released = True
+
+
+class _Stopped:
+    def stop(self) -> None:
+        pass
+
+
+def _bare_window(draft_service) -> MainWindow:
+    # Only the state _on_close and the draft writer use; no Tk interpreter
+    win = MainWindow.__new__(MainWindow)
+    win.instance_index = 1
+    win.draft_service = draft_service
+    win._draft_pool = ThreadPoolExecutor(max_workers=1)
+    win._io_pool = ThreadPoolExecutor(max_workers=1)
+    win._code_pool = ThreadPoolExecutor(max_workers=1)
+    win._draft_write = None
+    win._draft_on_disk = None
+    win._draft_write_failed = threading.Event()
+    win._draft_dirty = True
+    win._saved_sig = None
+    win._buffer_text = lambda: "note body\n"
+    win._tick_heap, win._tick_live, win._tick_after_id = [], set(), None
+    win._global_paste = win._global_macro = _Stopped()
+    win.highlighter = type("_Hl", (), {"close": lambda self: None})()
+    win.after_threads = []
+    win.after = lambda *_a: win.after_threads.append(threading.current_thread())
+    win.destroy = lambda: None
+    return win
+
+
+class DraftCloseTests(unittest.TestCase):
+    def test_failed_final_write_does_not_block_close(self) -> None:
+        service = _FailingDraftService()
+        win = _bare_window(service)
+        closer = threading.Thread(target=win._on_close, daemon=True)
+        closer.start()
+        closer.join(timeout=5)
+        self.assertFalse(closer.is_alive(), "_on_close hung on the draft worker")
+        self.assertTrue(service.released)
+        # The worker reported the failure without calling into Tk
+        self.assertEqual(win.after_threads, [])
+        self.assertTrue(win._draft_write_failed.is_set())
+
+    def test_failed_write_is_retried_on_next_flush(self) -> None:
+        win = _bare_window(_FailingDraftService())
+        win._save_draft_now()
+        win._draft_pool.shutdown(wait=True)
+        win._draft_pool = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(win._draft_pool.shutdown)
+        submitted = []
+        win._draft_pool.submit = lambda fn, text: submitted.append(text)
+        # Same content as the failed write: the signature alone would skip it
+        win._save_draft_now("note body\n")
+        self.assertEqual(submitted, ["note body\n"])
+        self.assertFalse(win._draft_write_failed.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import threading
+import time
+import unittest
+
+from app.services.markdown_highlighter import MarkdownHighlighter
+
+
+class NumberHighlightTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.hl = MarkdownHighlighter()
+        self.addCleanup(self.hl.close)
+
+    def _spans(self, content: str, tag: str):
+        return [(s, e) for t, s, e in self.hl.scan(content).spans if t == tag]
+
+    def test_ascii_numbers(self) -> None:
+        self.assertEqual(
+            self._spans("x 5 y 1,000.5 .25", "md_number"), [(2, 3), (6, 13), (14, 17)]
+        )
+
+    def test_accented_letters_are_word_characters(self) -> None:
+        self.assertEqual(self._spans("café5 x", "md_number"), [])
+        self.assertEqual(self._spans("é12", "md_number"), [])
+
+    def test_non_ascii_digits(self) -> None:
+        self.assertEqual(self._spans("٣ apples", "md_number"), [(0, 1)])
+        self.assertEqual(self._spans("١٢. item", "md_ol_marker"), [(0, 3)])
+
+
+class _FakeText:
+    """Just enough of tk.Text for highlight_async; timers run via run_timers()."""
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self.modified = False
+        self.timers = []
+        self.after_threads = set()
+
+    def get(self, _start, _end) -> str:
+        return self.content
+
+    def edit_modified(self) -> bool:
+        return self.modified
+
+    def after(self, _ms, func) -> None:
+        self.after_threads.add(threading.current_thread())
+        self.timers.append(func)
+
+    def run_timers(self, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while self.timers and time.monotonic() < deadline:
+            self.timers.pop(0)()
+            time.sleep(0.001)
+
+
+class HighlightAsyncTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.hl = MarkdownHighlighter()
+        self.addCleanup(self.hl.close)
+        self.applied = []
+        self.hl.apply = lambda _text, res: self.applied.append(res.content)
+
+    def test_result_applied_from_calling_thread_only(self) -> None:
+        text = _FakeText("# title\n")
+        self.hl.highlight_async(text)
+        text.run_timers()
+        self.assertEqual(self.applied, ["# title\n"])
+        self.assertEqual(text.after_threads, {threading.current_thread()})
+
+    def test_result_for_edited_content_is_dropped(self) -> None:
+        text = _FakeText("# title\n")
+        self.hl.highlight_async(text)
+        # A keystroke lands before <<Modified>> gets to cancel the pass
+        text.content, text.modified = "\n# title\n", True
+        text.run_timers()
+        self.assertEqual(self.applied, [])
+
+
+if __name__ == "__main__":
+    unittest.main()